@@ -1,6 +1,7 @@
 """Main Telegram bot with webhook and scheduler."""
 
 import asyncio
+import atexit
 import logging
 import signal
 from datetime import UTC, datetime, timedelta
@@ -22,7 +23,7 @@ from handlers.share import share_handler
 from handlers.start import start_handler
 from handlers.update import update_conversation_handler
 from health_handler import start_health_server
-from utils.logging_config import setup_rotating_file_handler
+from utils.logging_config import setup_queue_logging, setup_rotating_file_handler
 
 # Load environment variables
 load_dotenv()
@@ -43,13 +44,14 @@ CLEANUP_HOUR = cfg.cleanup_hour
 # Setup rotating file handler using shared utility
 file_handler = setup_rotating_file_handler("data/repackit.log")
 
+# Console and file writes happen on a listener thread, off the event loop
+queue_handler, log_listener = setup_queue_logging([logging.StreamHandler(), file_handler])
+log_listener.start()
+atexit.register(log_listener.stop)
+
 logging.basicConfig(
     level=getattr(logging, cfg.log_level.upper()),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(),
-        file_handler,
-    ],
+    handlers=[queue_handler],
 )
 logger = logging.getLogger(__name__)
 
@@ -200,7 +202,17 @@ def setup_signal_handlers() -> None:  # pragma: no cover
 
 
 async def post_init(application: Application) -> None:  # pragma: no cover
-    """Initialize background tasks after bot startup."""
+    """Initialize database and background tasks after bot startup."""
+    # Initialize database and record startup time on the application's event loop,
+    # so the shared connection is opened on the same loop that serves handlers and /health
+    logger.info("Initializing database...")
+    await database.init_db()
+
+    # Record bot startup time for health check grace period
+    startup_time = datetime.now(UTC).isoformat()
+    await database.update_system_status("bot_startup_time", startup_time)
+    logger.info(f"Bot startup time recorded: {startup_time}")
+
     logger.info("Starting background tasks...")
 
     # Start scheduler tasks
@@ -234,15 +246,6 @@ def main() -> None:  # pragma: no cover
         )
         return
 
-    # Initialize database and record startup time (synchronously)
-    logger.info("Initializing database...")
-    asyncio.run(database.init_db())
-
-    # Record bot startup time for health check grace period
-    startup_time = datetime.now(UTC).isoformat()
-    asyncio.run(database.update_system_status("bot_startup_time", startup_time))
-    logger.info(f"Bot startup time recorded: {startup_time}")
-
     # Create bot application with post_init callback
     logger.info("Creating bot application...")
     application = (
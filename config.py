@@ -51,6 +51,7 @@ class Config:
     health_port: int
     health_bind_address: str
     health_check_max_days: int  # Max days since last task run before considered stale
+    health_cache_ttl: float  # Seconds a computed health status is reused (0 disables caching)
 
     # Feedback
     feedback_min_length: int  # Minimum feedback message length
@@ -111,6 +112,7 @@ class Config:
             health_port=int(os.getenv("HEALTH_PORT", "8444")),
             health_bind_address=os.getenv("HEALTH_BIND_ADDRESS", "0.0.0.0"),
             health_check_max_days=int(os.getenv("HEALTH_CHECK_MAX_DAYS", "2")),
+            health_cache_ttl=float(os.getenv("HEALTH_CACHE_TTL", "2.0")),
             # Feedback
             feedback_min_length=int(os.getenv("FEEDBACK_MIN_LENGTH", "10")),
             feedback_max_length=int(os.getenv("FEEDBACK_MAX_LENGTH", "1000")),
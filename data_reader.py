@@ -1,10 +1,12 @@
 """Amazon data reader for price scraping."""
 
 import asyncio
+import contextlib
 import logging
 import re
+import time
 
-from playwright.async_api import Browser, TimeoutError, async_playwright
+from playwright.async_api import Error, Page, Route, TimeoutError, async_playwright
 
 from config import get_config
 
@@ -15,8 +17,8 @@ logger = logging.getLogger(__name__)
 
 
 # ASIN pattern: 10 alphanumeric characters
-# Supports: /dp/, /gp/product/, and short links /d/
-ASIN_PATTERN = re.compile(r"/dp/([A-Z0-9]{10})|/gp/product/([A-Z0-9]{10})|/d/([A-Z0-9]{10})")
+# Supports: /dp/, /gp/product/, and short links /d/ (one capture group for all three)
+ASIN_PATTERN = re.compile(r"/(?:dp|gp/product|d)/([A-Z0-9]{10})")
 cfg = get_config()
 
 # Module-level constants for backward compatibility with tests
@@ -27,6 +29,12 @@ SCRAPER_RATE_LIMIT_SECONDS = cfg.scraper_rate_limit_seconds
 # Marketplace pattern: extract domain suffix (it, com, de, fr, co.uk, etc.)
 MARKETPLACE_PATTERN = re.compile(r"amazon\.(?:co\.)?([a-z]{2,3})")
 
+# Price number pattern: first decimal number in a normalized price string
+PRICE_NUMBER_PATTERN = re.compile(r"(\d+\.?\d*)")
+
+# Translation table removing currency symbols and spaces from price text in one pass
+PRICE_STRIP_TABLE = str.maketrans("", "", "€$ ")
+
 # Price selectors to try in order (Amazon's HTML structure changes frequently)
 # More specific selectors first to avoid capturing wrong prices (variants, other sellers, etc.)
 PRICE_SELECTORS = [
@@ -48,6 +56,23 @@ PRICE_SELECTORS = [
     ".a-price-whole",  # Separated price (need to combine with decimal)
 ]
 
+# Matches as soon as any of the price selectors is on the page
+PRICE_SELECTOR_ANY = ", ".join(PRICE_SELECTORS)
+
+# How long to keep waiting for the most specific selector once any price has rendered.
+# Less specific prices (variants, other sellers) can appear before the buy box one.
+PRIMARY_PRICE_GRACE_MS = 1000
+
+# Realistic user agent to avoid detection
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Resource types never needed to read the price (images dominate an Amazon product page).
+# Stylesheets are kept: selector visibility checks depend on them.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
 
 def extract_asin(url: str) -> tuple[str, str]:
     """
@@ -74,8 +99,8 @@ def extract_asin(url: str) -> tuple[str, str]:
     if not asin_match:
         raise ValueError(f"Could not extract ASIN from URL: {url}")
 
-    # Get first non-None group (/dp/, /gp/product/, or /d/ for short links)
-    asin = asin_match.group(1) or asin_match.group(2) or asin_match.group(3)
+    # Same group for /dp/, /gp/product/, and /d/ (short links)
+    asin = asin_match.group(1)
 
     # Extract marketplace
     marketplace_match = MARKETPLACE_PATTERN.search(url)
@@ -136,12 +161,25 @@ async def scrape_price(asin: str, marketplace: str = "it") -> float | None:
     return results.get(0)
 
 
-async def _scrape_single_price(browser: Browser, asin: str, marketplace: str) -> float | None:
+async def _block_heavy_resources(route: Route) -> None:
+    """
+    Abort requests for resources that are not needed to read the price.
+
+    Args:
+        route: Playwright route for the intercepted request
+    """
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _scrape_single_price(page: Page, asin: str, marketplace: str) -> float | None:
     """
-    Internal function to scrape price using existing browser instance.
+    Internal function to scrape price using an existing page.
 
     Args:
-        browser: Playwright browser instance
+        page: Playwright page, reused across products
         asin: Amazon Standard Identification Number
         marketplace: Country code
 
@@ -151,36 +189,44 @@ async def _scrape_single_price(browser: Browser, asin: str, marketplace: str) ->
     url = f"https://amazon.{marketplace}/dp/{asin}"
 
     try:
-        # Create new page
-        page = await browser.new_page()
-
-        # Set realistic user agent to avoid detection
-        await page.set_extra_http_headers(
-            {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            }
-        )
-
         # Navigate to product page
         logger.debug(f"Scraping {url}")
         await page.goto(url, wait_until="domcontentloaded", timeout=30000)
 
-        # Try each price selector
+        # Wait once for any price selector instead of timing out on each missing one.
+        # "attached", not the default "visible": with a selector list Playwright only
+        # checks the first DOM match, which may be a hidden price node. Visibility is
+        # checked per element below.
+        try:
+            await page.wait_for_selector(PRICE_SELECTOR_ANY, state="attached", timeout=5000)
+        except TimeoutError:
+            logger.warning(f"Could not find price for ASIN {asin} on amazon.{marketplace}")
+            return None
+
+        # Some price is on the page: give the buy box price a short grace period so an
+        # earlier-rendered, less specific price does not win the priority order below
+        try:
+            await page.wait_for_selector(PRICE_SELECTORS[0], timeout=PRIMARY_PRICE_GRACE_MS)
+        except TimeoutError:
+            logger.debug(f"Primary price selector not found for ASIN {asin}, falling back")
+
+        # Read the most specific visible selector without further waits
         price_text = None
         for i, selector in enumerate(PRICE_SELECTORS, 1):
-            try:
-                element = await page.wait_for_selector(selector, timeout=2000)
-                if element:
-                    price_text = await element.inner_text()
-                    if price_text:
-                        logger.info(f"Found price with selector #{i} '{selector}': {price_text}")
-                        break
-            except TimeoutError:
+            element = await page.query_selector(selector)
+            if element is None:
                 logger.debug(f"Selector #{i} '{selector}' not found, trying next...")
                 continue
-
-        await page.close()
+            try:
+                if await element.is_visible():
+                    price_text = await element.inner_text()
+            finally:
+                # Release the browser-side handle: the page is reused for every
+                # ASIN, so undisposed handles would pile up for the whole run
+                await element.dispose()
+            if price_text:
+                logger.info(f"Found price with selector #{i} '{selector}': {price_text}")
+                break
 
         if not price_text:
             logger.warning(f"Could not find price for ASIN {asin} on amazon.{marketplace}")
@@ -211,7 +257,7 @@ def _parse_price(price_text: str) -> float | None:
     """
     try:
         # Remove currency symbols and whitespace
-        cleaned = price_text.strip().replace("€", "").replace("$", "").replace(" ", "")
+        cleaned = price_text.strip().translate(PRICE_STRIP_TABLE)
 
         # Auto-detect format: decimal separator is always rightmost
         last_comma = cleaned.rfind(",")
@@ -225,7 +271,7 @@ def _parse_price(price_text: str) -> float | None:
             cleaned = cleaned.replace(",", "")
 
         # Extract first number (handles ranges: "59.90 - 69.90")
-        match = re.search(r"(\d+\.?\d*)", cleaned)
+        match = PRICE_NUMBER_PATTERN.search(cleaned)
         if match:
             price = float(match.group(1))
             if 0.01 <= price <= 999999:
@@ -244,7 +290,8 @@ async def scrape_prices(
     """
     Scrape prices for multiple products efficiently.
 
-    Uses a single browser instance and applies rate limiting to avoid detection.
+    Reuses one browser page (replaced after a failed scrape) and applies rate limiting
+    to avoid detection.
     Optimizes scraping by deduplicating ASINs - each unique ASIN is scraped only once,
     even if multiple users are monitoring the same product.
 
@@ -263,6 +310,8 @@ async def scrape_prices(
     if rate_limit_seconds is None:
         rate_limit_seconds = SCRAPER_RATE_LIMIT_SECONDS
 
+    # Monotonic clock for run duration (no datetime objects, unaffected by clock changes)
+    start = time.perf_counter()
     results = {}
 
     # Group products by (asin, marketplace) to deduplicate scraping
@@ -287,14 +336,33 @@ async def scrape_prices(
         # Connect to the obscura headless browser sidecar over the Chrome DevTools
         # Protocol instead of launching a bundled Chromium. obscura is a lightweight
         # Rust CDP server (~70MB / ~30MB RAM vs ~300MB Chromium) that runs alongside
-        # the bot. Closing the browser below only disconnects this client; the sidecar
-        # stays alive and is reused by the next scheduled run.
+        # the bot. Closing the browser below only disconnects this client (dropping the
+        # context created here); the sidecar stays alive and is reused by the next
+        # scheduled run.
         browser = await p.chromium.connect_over_cdp(cfg.obscura_cdp_endpoint)
 
         try:
+            # One context and page for the run, with images/fonts/media blocked
+            context = await browser.new_context(user_agent=USER_AGENT)
+            await context.route("**/*", _block_heavy_resources)
+            page = await context.new_page()
+
             for i, (asin, marketplace) in enumerate(unique_asins):
-                # Scrape price once for this ASIN
-                price = await _scrape_single_price(browser, asin, marketplace)
+                async with asyncio.TaskGroup() as tg:
+                    # Rate limiting: start the delay alongside the request so page load
+                    # time counts towards it (requests still start rate_limit apart)
+                    if i < len(unique_asins) - 1:  # Don't wait after last ASIN
+                        tg.create_task(asyncio.sleep(rate_limit_seconds))
+
+                    # Scrape price once for this ASIN
+                    price = await _scrape_single_price(page, asin, marketplace)
+
+                # A failed scrape may have left the page crashed, closed or stuck
+                # mid-navigation: continue on a fresh page so the failure stays isolated
+                if price is None and i < len(unique_asins) - 1:
+                    with contextlib.suppress(Error):
+                        await page.close()
+                    page = await context.new_page()
 
                 # Map price to all product IDs that share this ASIN
                 if price is not None:
@@ -305,14 +373,13 @@ async def scrape_prices(
                         f"ASIN {asin} (€{price:.2f}) mapped to {len(product_ids)} product(s)"
                     )
 
-                # Rate limiting: wait before next request
-                if i < len(unique_asins) - 1:  # Don't wait after last ASIN
-                    await asyncio.sleep(rate_limit_seconds)
-
         finally:
             await browser.close()
 
-    logger.info(f"Scraped {len(results)}/{len(products)} products successfully")
+    logger.info(
+        f"Scraped {len(results)}/{len(products)} products successfully "
+        f"in {time.perf_counter() - start:.1f}s"
+    )
     return results
 
 
@@ -331,6 +398,10 @@ if __name__ == "__main__":
     # Load environment variables
     load_dotenv()
 
+    # Report separators, built once instead of on every print
+    SEPARATOR = "=" * 70
+    SECTION_BREAK = "\n" + SEPARATOR
+
     def _print_asin_extraction_test():
         """Print ASIN extraction test results."""
         test_urls = [
@@ -339,9 +410,9 @@ if __name__ == "__main__":
             "https://www.amazon.it/Product-Name/dp/B08N5WRWNW/ref=sr_1_1",
         ]
 
-        print("=" * 70)
+        print(SEPARATOR)
         print("ASIN EXTRACTION TEST")
-        print("=" * 70)
+        print(SEPARATOR)
         for url in test_urls:
             asin, marketplace = extract_asin(url)
             print(f"\nURL: {url}")
@@ -349,12 +420,12 @@ if __name__ == "__main__":
             print(f"  Marketplace: amazon.{marketplace}")
             print(f"  Affiliate URL: {build_affiliate_url(asin, marketplace)}")
 
-        print("\n" + "=" * 70)
+        print(SECTION_BREAK)
 
     async def _scrape_single_product(asin: str, marketplace: str):
         """Scrape a single product by ASIN."""
         print(f"SINGLE PRODUCT SCRAPE: {asin} (amazon.{marketplace})")
-        print("=" * 70)
+        print(SEPARATOR)
 
         price = await scrape_price(asin, marketplace)
         if price:
@@ -369,7 +440,7 @@ if __name__ == "__main__":
     async def _scrape_all_products():
         """Scrape all products from database."""
         print("ALL PRODUCTS SCRAPE (from database)")
-        print("=" * 70)
+        print(SEPARATOR)
 
         # Initialize database
         await database.init_db()
@@ -392,9 +463,9 @@ if __name__ == "__main__":
         results = await scrape_prices(products)
 
         # Show results
-        print("\n" + "=" * 70)
+        print(SECTION_BREAK)
         print("SCRAPING RESULTS")
-        print("=" * 70)
+        print(SEPARATOR)
 
         for product in products:
             product_id = product["id"]
@@ -414,9 +485,9 @@ if __name__ == "__main__":
         total_count = len(products)
         success_rate = (success_count / total_count * 100) if total_count > 0 else 0
 
-        print("\n" + "=" * 70)
+        print(SECTION_BREAK)
         print(f"Success Rate: {success_count}/{total_count} ({success_rate:.1f}%)")
-        print("=" * 70)
+        print(SEPARATOR)
 
     async def main():
         """Main function for manual testing and scraping."""
@@ -22,6 +22,31 @@ PRODUCTS_PER_REFERRAL = cfg.products_per_referral
 INVITED_USER_BONUS = cfg.invited_user_bonus
 
 
+def _connect() -> aiosqlite.Connection:
+    """
+    Open a connection to DATABASE_PATH.
+
+    Paths starting with "file:" are opened as SQLite URIs, which allows tests to use
+    shared in-memory databases (e.g. "file:test?mode=memory&cache=shared").
+
+    Returns:
+        aiosqlite connection (await it or use it as an async context manager)
+    """
+    if DATABASE_PATH.startswith("file:"):
+        return aiosqlite.connect(DATABASE_PATH, uri=True)
+    return aiosqlite.connect(DATABASE_PATH)
+
+
+# Insert or overwrite a system_status key (used by update_system_status and cleanup)
+_UPSERT_SYSTEM_STATUS_SQL = """
+    INSERT INTO system_status (key, value, updated_at)
+    VALUES (?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(key) DO UPDATE SET
+        value = excluded.value,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+
 class DatabaseConnection:
     """
     Manages a persistent database connection for better performance.
@@ -63,10 +88,12 @@ class DatabaseConnection:
 
     async def _create_connection(self) -> None:
         """Create a new database connection with optimized settings."""
-        # Ensure data directory exists
-        os.makedirs(os.path.dirname(DATABASE_PATH), exist_ok=True)
+        # Ensure data directory exists. Done here only, not in _connect: the dedicated
+        # connections opened per atomic operation come after the shared one
+        if not DATABASE_PATH.startswith("file:"):
+            os.makedirs(os.path.dirname(DATABASE_PATH), exist_ok=True)
 
-        self._connection = await aiosqlite.connect(DATABASE_PATH)
+        self._connection = await _connect()
         # Enable WAL mode for better concurrency
         await self._connection.execute("PRAGMA journal_mode=WAL")
         # Enable foreign keys
@@ -452,7 +479,7 @@ async def add_product_atomic(
     # Use a dedicated connection for atomic operations requiring explicit transaction control.
     # This avoids "cannot start a transaction within a transaction" errors when using
     # the shared connection, and allows concurrent atomic operations.
-    async with aiosqlite.connect(DATABASE_PATH) as db:
+    async with _connect() as db:
         # Start IMMEDIATE transaction to lock the database for writing
         await db.execute("BEGIN IMMEDIATE")
 
@@ -655,17 +682,35 @@ async def delete_product(product_id: int, user_id: int) -> bool:
     return deleted
 
 
-async def delete_expired_products() -> int:
+async def delete_expired_products_and_mark_run(timestamp: str) -> int:
     """
-    Delete all products where return_deadline < today (UTC).
+    Record the cleanup run and delete expired products in a single transaction.
+
+    Upserts last_cleanup_run and deletes all products where return_deadline < today (UTC)
+    with one commit. If either statement fails, neither is applied.
+
+    Args:
+        timestamp: ISO timestamp of the cleanup run
 
     Returns:
         Number of products deleted
     """
     today = datetime.now(UTC).date().isoformat()
-    db = await get_db()
-    cursor = await db.execute("DELETE FROM products WHERE return_deadline < ?", (today,))
-    await db.commit()
+
+    # Dedicated connection, as in add_product_atomic: a rollback here must not discard
+    # uncommitted writes made by other coroutines on the shared connection.
+    async with _connect() as db:
+        await db.execute("BEGIN IMMEDIATE")
+
+        try:
+            await db.execute(_UPSERT_SYSTEM_STATUS_SQL, ("last_cleanup_run", timestamp))
+            cursor = await db.execute("DELETE FROM products WHERE return_deadline < ?", (today,))
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            logger.exception("Error in delete_expired_products_and_mark_run")
+            raise
+
     count = cursor.rowcount
     logger.info(f"Deleted {count} expired products")
     return count
@@ -745,16 +790,7 @@ async def update_system_status(key: str, value: str) -> None:
         value: Status value (typically ISO timestamp)
     """
     db = await get_db()
-    await db.execute(
-        """
-        INSERT INTO system_status (key, value, updated_at)
-        VALUES (?, ?, CURRENT_TIMESTAMP)
-        ON CONFLICT(key) DO UPDATE SET
-            value = excluded.value,
-            updated_at = CURRENT_TIMESTAMP
-        """,
-        (key, value),
-    )
+    await db.execute(_UPSERT_SYSTEM_STATUS_SQL, (key, value))
     await db.commit()
     logger.debug(f"System status updated: {key} = {value}")
 
@@ -835,6 +871,11 @@ async def get_metric(key: str) -> float:
         Metric value as float, or 0.0 if key doesn't exist
     """
     status = await get_system_status(key)
+    return _parse_metric(key, status)
+
+
+def _parse_metric(key: str, status: dict | None) -> float:
+    """Convert a system_status entry to a metric value (0.0 if missing or invalid)."""
     if status is None:
         return 0.0
     try:
@@ -844,6 +885,37 @@ async def get_metric(key: str) -> float:
         return 0.0
 
 
+async def _get_counts() -> tuple[int, int, int]:
+    """
+    Count users, products and unique (asin, marketplace) pairs in a single query.
+
+    The unique count matches the scraper's deduplication logic in data_reader.py.
+    """
+    db = await get_db()
+    async with db.execute(
+        """
+        SELECT
+            (SELECT COUNT(*) FROM users),
+            (SELECT COUNT(*) FROM products),
+            (SELECT COUNT(DISTINCT asin || '|' || marketplace) FROM products)
+        """
+    ) as cursor:
+        user_count, product_count, unique_product_count = await cursor.fetchone()
+    return user_count, product_count, unique_product_count
+
+
+def _build_stats(counts: tuple[int, int, int], products_total: float, savings: float) -> dict:
+    """Assemble the stats dict returned by get_stats and get_health_snapshot."""
+    user_count, product_count, unique_product_count = counts
+    return {
+        "user_count": user_count,
+        "product_count": product_count,
+        "unique_product_count": unique_product_count,
+        "products_total_count": int(products_total),
+        "total_savings_generated": round(savings, 2),
+    }
+
+
 async def get_stats() -> dict:
     """
     Get database statistics for health check.
@@ -859,30 +931,35 @@ async def get_stats() -> dict:
         - products_total_count: Total products registered since beginning (promotional metric)
         - total_savings_generated: Total € savings notified to users (promotional metric)
     """
-    db = await get_db()
-    # Count users
-    async with db.execute("SELECT COUNT(*) FROM users") as cursor:
-        user_count = (await cursor.fetchone())[0]
-
-    # Count total products (includes duplicates)
-    async with db.execute("SELECT COUNT(*) FROM products") as cursor:
-        product_count = (await cursor.fetchone())[0]
-
-    # Count unique products by (asin, marketplace) pair
-    # This matches the scraper's deduplication logic in data_reader.py
-    async with db.execute(
-        "SELECT COUNT(DISTINCT asin || '|' || marketplace) FROM products"
-    ) as cursor:
-        unique_product_count = (await cursor.fetchone())[0]
+    counts = await _get_counts()
 
     # Get promotional metrics from system_status
     products_total_count = await get_metric("products_total_count")
     total_savings_generated = await get_metric("total_savings_generated")
 
-    return {
-        "user_count": user_count,
-        "product_count": product_count,
-        "unique_product_count": unique_product_count,
-        "products_total_count": int(products_total_count),
-        "total_savings_generated": round(total_savings_generated, 2),
-    }
+    return _build_stats(counts, products_total_count, total_savings_generated)
+
+
+async def get_health_snapshot() -> tuple[dict, dict[str, dict]]:
+    """
+    Get database statistics and all system status entries for the health check.
+
+    Equivalent to calling get_stats() and get_all_system_status(), but the
+    promotional metrics are read from the system_status rows already fetched,
+    so the whole snapshot costs two queries instead of six.
+
+    Returns:
+        Tuple of (stats, system_status) with the same shapes as get_stats()
+        and get_all_system_status()
+    """
+    counts = await _get_counts()
+    system_status = await get_all_system_status()
+
+    products_total_count = _parse_metric(
+        "products_total_count", system_status.get("products_total_count")
+    )
+    total_savings_generated = _parse_metric(
+        "total_savings_generated", system_status.get("total_savings_generated")
+    )
+
+    return _build_stats(counts, products_total_count, total_savings_generated), system_status
@@ -5,7 +5,7 @@ This module contains reusable validation logic extracted from add.py and update.
 to avoid duplication and improve testability.
 """
 
-import re
+import functools
 from datetime import UTC, date, datetime, timedelta
 
 
@@ -82,9 +82,9 @@ def validate_price(price_str: str, max_digits: int = 16) -> tuple[bool, float |
                 ),
             )
 
-        # Validate max digits (including decimals)
-        digits_only = re.sub(r"[,.]", "", price_str)
-        if len(digits_only) > max_digits:
+        # Validate max digits (including decimals); counting separators avoids a regex pass
+        digit_count = len(price_str) - price_str.count(",") - price_str.count(".")
+        if digit_count > max_digits:
             return (
                 False,
                 None,
@@ -190,11 +190,16 @@ def parse_deadline(deadline_input: str) -> date:
     Raises:
         ValueError: If input format is invalid or out of range
     """
-    deadline_input = deadline_input.strip()
+    # The result depends on today's date, so it is part of the cache key
+    return _parse_deadline_on(deadline_input.strip(), datetime.now(UTC).date())
 
+
+@functools.lru_cache(maxsize=256)
+def _parse_deadline_on(deadline_input: str, today: date) -> date:
+    """Parse stripped deadline input relative to today (cached; invalid inputs raise)."""
     # Try parsing as number of days
     try:
-        return _parse_days_to_deadline(deadline_input)
+        return _parse_days_to_deadline(deadline_input, today)
     except ValueError as e:
         # If it's our specific error about days range, re-raise it
         if "giorni deve essere" in str(e):
@@ -202,10 +207,10 @@ def parse_deadline(deadline_input: str) -> date:
         # Otherwise, it's not a number, fall through to try date format
 
     # Try parsing as date (gg-mm-aaaa or gg/mm/aaaa)
-    return _parse_date_string_to_deadline(deadline_input)
+    return _parse_date_string_to_deadline(deadline_input, today)
 
 
-def _parse_days_to_deadline(days_str: str) -> date:
+def _parse_days_to_deadline(days_str: str, today: date) -> date:
     """Parse deadline from number of days (1-365)."""
     days = int(days_str)
     if days < 1 or days > 365:
@@ -213,12 +218,13 @@ def _parse_days_to_deadline(days_str: str) -> date:
             "Il numero di giorni deve essere tra 1 e 365. "
             "Il bot ha bisogno di almeno 1 giorno per monitorare il prezzo!"
         )
-    return datetime.now(UTC).date() + timedelta(days=days)
+    return today + timedelta(days=days)
 
 
-def _parse_date_string_to_deadline(date_str: str) -> date:
+def _parse_date_string_to_deadline(date_str: str, today: date) -> date:
     """Parse deadline from date string (gg-mm-aaaa or aaaa-mm-gg)."""
-    parts = re.split(r"[-/]", date_str)
+    # "-" and "/" are both accepted as separators; plain str methods, no regex
+    parts = date_str.replace("/", "-").split("-")
 
     if len(parts) != 3:
         raise ValueError(
@@ -226,7 +232,7 @@ def _parse_date_string_to_deadline(date_str: str) -> date:
         )
 
     deadline = _extract_date_from_parts(parts)
-    _validate_deadline_range(deadline)
+    _validate_deadline_range(deadline, today)
     return deadline
 
 
@@ -255,10 +261,8 @@ def _extract_date_from_parts(parts: list[str]) -> date:
         ) from None
 
 
-def _validate_deadline_range(deadline: date) -> None:
+def _validate_deadline_range(deadline: date, today: date) -> None:
     """Validate deadline is in acceptable range (tomorrow to 365 days)."""
-    today = datetime.now(UTC).date()
-
     if deadline <= today:
         if deadline == today:
             raise ValueError(
@@ -3,6 +3,7 @@
 import asyncio
 import json
 import logging
+import time
 from datetime import UTC, datetime, timedelta
 
 from aiohttp import web
@@ -20,6 +21,19 @@ cfg = get_config()
 HEALTH_PORT = cfg.health_port
 HEALTH_BIND_ADDRESS = cfg.health_bind_address
 MAX_DAYS_SINCE_LAST_RUN = cfg.health_check_max_days
+HEALTH_CACHE_TTL = cfg.health_cache_ttl
+
+# Last computed health status as (monotonic timestamp, status dict)
+_health_cache: tuple[float, dict] | None = None
+_health_cache_lock = asyncio.Lock()
+
+# Pretty-printed JSON encoder (indent=2 for browser readability), built once:
+# json.dumps() with non-default options constructs a new encoder on every call
+_json_encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+# Last serialized response as (status dict, UTF-8 body); reused while the cached
+# status object is unchanged so probes within the cache TTL skip serialization
+_health_body: tuple[dict, bytes] | None = None
 
 
 def _format_datetime(dt: datetime) -> str:
@@ -35,11 +49,48 @@ def _format_datetime(dt: datetime) -> str:
     return dt.strftime("%Y-%m-%d %H:%M:%S")
 
 
+def _timestamp_key(value: str | None) -> str | None:
+    """
+    Get a sortable yyyy-mm-ddThh:mm:ss key for a stored timestamp, in UTC.
+
+    Keys of the same length sort chronologically, so they compare as plain strings.
+
+    Args:
+        value: ISO-8601 timestamp string (naive values are assumed UTC, offsets are
+            converted to UTC)
+
+    Returns:
+        19-character comparable key, or None if value is not a valid timestamp
+    """
+    if not isinstance(value, str):
+        return None
+    try:
+        dt = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(UTC)
+    return dt.strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def _format_timestamp_key(key: str) -> str:
+    """
+    Format a timestamp key to yyyy-mm-dd hh:mm:ss format.
+
+    Args:
+        key: Key returned by _timestamp_key
+
+    Returns:
+        Formatted string
+    """
+    return f"{key[:10]} {key[11:]}"
+
+
 def _check_task_health(
     task_name: str,
     system_status: dict,
-    threshold: datetime,
-    bot_startup_time: datetime | None,
+    threshold: str,
+    bot_startup_time: str | None,
 ) -> tuple[dict, bool]:
     """
     Check health status of a single task.
@@ -47,8 +98,8 @@ def _check_task_health(
     Args:
         task_name: Name of the task (scraper, checker, cleanup)
         system_status: Dict of all system status entries
-        threshold: Datetime threshold for considering task stale (2 days ago)
-        bot_startup_time: Bot startup time for grace period calculation
+        threshold: Timestamp key for considering task stale (2 days ago)
+        bot_startup_time: Bot startup timestamp key for grace period calculation
 
     Returns:
         Tuple of (task_status_dict, is_healthy)
@@ -72,23 +123,18 @@ def _check_task_health(
             return {"status": "never_run", "last_run": None}, False
 
     last_run_str = task_info["value"]
-    try:
-        last_run = datetime.fromisoformat(last_run_str)
-        # Ensure timezone-aware for comparison (assume UTC if naive)
-        if last_run.tzinfo is None:
-            last_run = last_run.replace(tzinfo=UTC)
-
-        is_healthy = last_run >= threshold
-        status_dict = {
-            "status": "ok" if is_healthy else "stale",
-            "last_run": _format_datetime(last_run),
-        }
-        return status_dict, is_healthy
-
-    except (ValueError, TypeError):
+    last_run = _timestamp_key(last_run_str)
+    if last_run is None:
         logger.warning(f"Invalid timestamp for {key}: {last_run_str}")
         return {"status": "error", "last_run": last_run_str}, False
 
+    is_healthy = last_run >= threshold
+    status_dict = {
+        "status": "ok" if is_healthy else "stale",
+        "last_run": _format_timestamp_key(last_run),
+    }
+    return status_dict, is_healthy
+
 
 async def get_health_status() -> dict:
     """
@@ -103,21 +149,18 @@ async def get_health_status() -> dict:
         - bot_startup_time: When the bot started (for grace period tracking)
     """
     now = datetime.now(UTC)
-    threshold = now - timedelta(days=MAX_DAYS_SINCE_LAST_RUN)
+    # Computed once and compared as a string against every stored timestamp
+    threshold = _timestamp_key((now - timedelta(days=MAX_DAYS_SINCE_LAST_RUN)).isoformat())
 
     # Get database stats and system status
-    stats = await database.get_stats()
-    system_status = await database.get_all_system_status()
+    stats, system_status = await database.get_health_snapshot()
 
     # Get bot startup time for grace period calculation
     bot_startup_info = system_status.get("bot_startup_time")
     bot_startup_time = None
     if bot_startup_info:
-        try:
-            bot_startup_time = datetime.fromisoformat(bot_startup_info["value"])
-            if bot_startup_time.tzinfo is None:
-                bot_startup_time = bot_startup_time.replace(tzinfo=UTC)
-        except (ValueError, TypeError):
+        bot_startup_time = _timestamp_key(bot_startup_info["value"])
+        if bot_startup_time is None:
             logger.warning(f"Invalid bot_startup_time: {bot_startup_info['value']}")
 
     # Check each task's health status
@@ -146,11 +189,69 @@ async def get_health_status() -> dict:
 
     # Add bot_startup_time if available
     if bot_startup_time:
-        result["bot_startup_time"] = _format_datetime(bot_startup_time)
+        result["bot_startup_time"] = _format_timestamp_key(bot_startup_time)
 
     return result
 
 
+async def get_cached_health_status() -> dict:
+    """
+    Get health status, reusing a recent result for up to HEALTH_CACHE_TTL seconds.
+
+    Monitoring probes can hit /health every few seconds; bursts of requests
+    within the TTL window share a single set of database queries.
+
+    Returns:
+        Health status dict (see get_health_status)
+    """
+    global _health_cache
+
+    if HEALTH_CACHE_TTL <= 0:
+        return await get_health_status()
+
+    cached = _health_cache
+    if cached is not None and time.monotonic() - cached[0] < HEALTH_CACHE_TTL:
+        return cached[1]
+
+    async with _health_cache_lock:
+        # Another request may have refreshed the cache while we were waiting
+        cached = _health_cache
+        if cached is not None and time.monotonic() - cached[0] < HEALTH_CACHE_TTL:
+            return cached[1]
+
+        health_data = await get_health_status()
+        _health_cache = (time.monotonic(), health_data)
+        return health_data
+
+
+def reset_health_cache() -> None:
+    """Discard the cached health status and response body (for testing)."""
+    global _health_cache, _health_body
+    _health_cache = None
+    _health_body = None
+
+
+def _encode_health_body(health_data: dict) -> bytes:
+    """
+    Serialize health status to pretty-printed UTF-8 JSON.
+
+    Args:
+        health_data: Health status dict
+
+    Returns:
+        Encoded response body, reused if health_data is the last serialized object
+    """
+    global _health_body
+
+    cached = _health_body
+    if cached is not None and cached[0] is health_data:
+        return cached[1]
+
+    body = _json_encoder.encode(health_data).encode("utf-8")
+    _health_body = (health_data, body)
+    return body
+
+
 async def health_check_handler(request: web.Request) -> web.Response:
     """
     Handle GET /health requests.
@@ -162,24 +263,15 @@ async def health_check_handler(request: web.Request) -> web.Response:
         Pretty-printed JSON response with health status (indent=2 for browser readability)
     """
     try:
-        health_data = await get_health_status()
-        # Use json.dumps with indent for pretty-printed output
-        json_str = json.dumps(health_data, indent=2, ensure_ascii=False)
-        return web.Response(
-            text=json_str,
-            content_type="application/json",
-            charset="utf-8",
-        )
+        health_data = await get_cached_health_status()
+        # Pass bytes so aiohttp writes them as-is instead of re-encoding a text body
+        body = _encode_health_body(health_data)
+        return web.Response(body=body, content_type="application/json")
     except Exception as e:
         logger.exception("Health check error")
         error_data = {"status": "error", "message": str(e)}
-        json_str = json.dumps(error_data, indent=2, ensure_ascii=False)
-        return web.Response(
-            text=json_str,
-            content_type="application/json",
-            charset="utf-8",
-            status=500,
-        )
+        body = _json_encoder.encode(error_data).encode("utf-8")
+        return web.Response(body=body, content_type="application/json", status=500)
 
 
 async def start_health_server():
@@ -213,7 +305,9 @@ async def start_health_server():
     app.router.add_get("/health", health_check_handler)
 
     # Setup and start server
-    runner = web.AppRunner(app)
+    # Access log disabled: monitoring probes would otherwise write one synchronous
+    # log line per request on the bot's event loop
+    runner = web.AppRunner(app, access_log=None)
     await runner.setup()
 
     site = web.TCPSite(runner, cfg.health_bind_address, cfg.health_port)
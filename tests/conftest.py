@@ -1,30 +1,38 @@
 """Shared test fixtures for RepackIt tests."""
 
-import os
-import tempfile
-from pathlib import Path
+import uuid
+from contextlib import asynccontextmanager
+from datetime import timedelta
 
+import aiosqlite
 import pytest
 
 import database
+from tests.helpers import TODAY
+
+
+@pytest.fixture(scope="session")
+def today():
+    """Today's UTC date (as used by the handlers), read once per session."""
+    return TODAY
 
 
 @pytest.fixture
-async def test_db():
-    """
-    Create a temporary test database with proper connection management.
+def tomorrow(today):
+    """Tomorrow's UTC date."""
+    return today + timedelta(days=1)
+
 
-    This fixture:
-    1. Creates a temporary database file
-    2. Resets the database connection manager singleton
-    3. Updates DATABASE_PATH to point to the temp file
-    4. Initializes the database schema
-    5. After test: closes connection, resets singleton, cleans up files
+@asynccontextmanager
+async def _database_at(db_path: str, init_schema: bool = True):
     """
-    # Create temporary database file
-    fd, db_path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
+    Point the database module at db_path for the duration of the block.
 
+    1. Resets the database connection manager singleton
+    2. Updates DATABASE_PATH to point to db_path
+    3. Initializes the database schema (unless init_schema is False)
+    4. On exit: closes connection, resets singleton, restores the original path
+    """
     # Store original path
     original_path = database.DATABASE_PATH
 
@@ -36,18 +44,117 @@ async def test_db():
     database.DATABASE_PATH = db_path
 
     # Initialize database with new path
-    await database.init_db()
+    if init_schema:
+        await database.init_db()
 
-    yield db_path
+    try:
+        yield db_path
+    finally:
+        # Cleanup: close connection and reset singleton
+        await database.close_db()
+        database.DatabaseConnection.reset()
 
-    # Cleanup: close connection and reset singleton
-    await database.close_db()
-    database.DatabaseConnection.reset()
+        # Restore original path
+        database.DATABASE_PATH = original_path
+
+
+async def _truncate_tables() -> None:
+    """Delete all rows (and AUTOINCREMENT counters) from every table, keeping the schema."""
+    db = await database.get_db()
+    # The connection is reused across tests: drop anything a failed test left pending
+    if db.in_transaction:
+        await db.rollback()
+
+    async with db.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+    ) as cursor:
+        tables = [row[0] for row in await cursor.fetchall()]
+
+    await db.execute("PRAGMA foreign_keys=OFF")
+    for table in tables:
+        # Table names come from sqlite_master, not from user input
+        await db.execute(f"DELETE FROM {table}")
+    await db.execute("DELETE FROM sqlite_sequence")
+    await db.commit()
+    await db.execute("PRAGMA foreign_keys=ON")
+
+
+@pytest.fixture(scope="session")
+async def _db_schema():
+    """
+    Create the shared-cache in-memory test database and its schema once per session.
+
+    A dedicated connection stays open for the whole session: an in-memory database
+    is freed as soon as its last connection closes. The name is unique per process,
+    so pytest-xdist workers each get their own database.
+    """
+    db_path = f"file:testdb_{uuid.uuid4().hex}?mode=memory&cache=shared"
+    original_path = database.DATABASE_PATH
+    keeper = await aiosqlite.connect(db_path, uri=True)
+    try:
+        async with _database_at(db_path):
+            pass
+        yield db_path
+    finally:
+        # test_db leaves the shared connection open between tests; close it here
+        if db_path == database.DATABASE_PATH:
+            await database.close_db()
+            database.DatabaseConnection.reset()
+            database.DATABASE_PATH = original_path
+        await keeper.close()
+
+
+@pytest.fixture
+async def test_db(_db_schema):
+    """
+    Provide an empty in-memory test database with proper connection management.
+
+    The schema is created once per session (see _db_schema); each test starts from
+    truncated tables instead of rebuilding it. No file is created or fsynced, and
+    extra connections (e.g. add_product_atomic) see the same data through the
+    shared cache.
+
+    The shared database connection also stays open from one test_db test to the
+    next instead of being closed and reopened (a new aiosqlite thread) every time.
+    """
+    if _db_schema != database.DATABASE_PATH:
+        await database.close_db()
+        database.DatabaseConnection.reset()
+        database.DATABASE_PATH = _db_schema
 
-    # Restore original path
-    database.DATABASE_PATH = original_path
+    await _truncate_tables()
+    yield _db_schema
+
+
+@pytest.fixture(scope="session")
+async def _schema_sql(_db_schema):
+    """DDL of the session database, replayed in one executescript call by file_test_db."""
+    async with (
+        aiosqlite.connect(_db_schema, uri=True) as db,
+        db.execute(
+            "SELECT sql FROM sqlite_master WHERE sql IS NOT NULL AND name NOT LIKE 'sqlite_%' "
+            "ORDER BY rowid"
+        ) as cursor,
+    ):
+        return ";\n".join(row[0] for row in await cursor.fetchall()) + ";"
+
+
+@pytest.fixture
+async def file_test_db(_schema_sql, tmp_path):
+    """
+    Create a temporary on-disk test database in tmp_path (cleaned up by pytest).
+
+    Needed by tests that race several connections against each other: a shared-cache
+    in-memory database fails with "table is locked" instead of waiting for the lock.
+    The schema is copied from the session database instead of running init_db, and
+    the WAL mode set by the connection manager is swapped for an in-memory rollback
+    journal without fsync: no -wal/-shm files are created and commits stay cheap.
+    """
+    db_path = str(tmp_path / "test.db")
 
-    # Remove temp files
-    Path(db_path).unlink(missing_ok=True)
-    Path(f"{db_path}-wal").unlink(missing_ok=True)
-    Path(f"{db_path}-shm").unlink(missing_ok=True)
+    async with _database_at(db_path, init_schema=False):
+        db = await database.get_db()
+        await db.execute("PRAGMA journal_mode=MEMORY")
+        await db.execute("PRAGMA synchronous=OFF")
+        await db.executescript(_schema_sql)
+        yield db_path
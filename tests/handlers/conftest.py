@@ -0,0 +1,63 @@
+"""Shared fixtures for handler tests."""
+
+import socket
+from datetime import UTC, datetime, time
+
+import pytest
+
+import database
+from handlers import add, update, validators
+from handlers import list as list_module
+
+
+@pytest.fixture(autouse=True)
+def block_network(monkeypatch):
+    """
+    Fail fast if a handler test opens a network connection (e.g. a real Telegram call).
+
+    Handlers must be tested against mocked bots only. Name resolution is blocked too,
+    so an accidental call errors out at once instead of waiting on a DNS timeout.
+    Unix sockets stay allowed, as the event loop relies on them internally.
+    """
+
+    def blocked_getaddrinfo(host, *args, **kwargs):
+        raise RuntimeError(f"Network access is disabled in handler tests: {host!r}")
+
+    def _guard(real_method):
+        def guarded(sock, address):
+            if sock.family != socket.AF_UNIX:
+                raise RuntimeError(f"Network access is disabled in handler tests: {address!r}")
+            return real_method(sock, address)
+
+        return guarded
+
+    monkeypatch.setattr(socket.socket, "connect", _guard(socket.socket.connect))
+    monkeypatch.setattr(socket.socket, "connect_ex", _guard(socket.socket.connect_ex))
+    monkeypatch.setattr(socket, "getaddrinfo", blocked_getaddrinfo)
+
+
+@pytest.fixture(autouse=True)
+def freeze_today(monkeypatch, today):
+    """
+    Pin the handlers' clock to the session-wide today fixture.
+
+    Tests build their expected deadlines from today; without this, a run crossing
+    midnight UTC would see the handlers move on to the next day mid-session.
+    """
+    frozen_now = datetime.combine(today, time(12), tzinfo=UTC)
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return frozen_now.astimezone(tz)
+
+    for module in (add, list_module, update, validators):
+        monkeypatch.setattr(module, "datetime", FrozenDatetime)
+
+
+@pytest.fixture
+async def seeded_user(test_db):
+    """Register user 123 (Italian) in the test database and return its ID."""
+    user_id = 123
+    await database.add_user(user_id, "it")
+    return user_id
@@ -1,10 +1,12 @@
 """Tests for handlers/add.py."""
 
-from datetime import date, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, create_autospec, patch
 
 import aiosqlite
 import pytest
+from telegram import Bot
 from telegram.ext import ConversationHandler
 
 import database
@@ -22,86 +24,77 @@ from handlers.add import (
     handle_url,
     start_add,
 )
-from handlers.validators import parse_deadline
-
-# ============================================================================
-# parse_deadline tests
-# ============================================================================
-
-
-def test_parse_deadline_days():
-    """Test parse_deadline with days format."""
-    today = date.today()
-    result = parse_deadline("30")
-    expected = today + timedelta(days=30)
-    assert result == expected
-
-
-def test_parse_deadline_days_min_boundary():
-    """Test parse_deadline with minimum days (1)."""
-    today = date.today()
-    result = parse_deadline("1")
-    expected = today + timedelta(days=1)
-    assert result == expected
-
-
-def test_parse_deadline_days_max_boundary():
-    """Test parse_deadline with maximum days (365)."""
-    today = date.today()
-    result = parse_deadline("365")
-    expected = today + timedelta(days=365)
-    assert result == expected
-
-
-def test_parse_deadline_days_below_range():
-    """Test parse_deadline with days below valid range (0)."""
-    with pytest.raises(ValueError, match="giorni deve essere tra 1 e 365"):
-        parse_deadline("0")
-
-
-def test_parse_deadline_days_above_range():
-    """Test parse_deadline with days above valid range (366)."""
-    with pytest.raises(ValueError, match="giorni deve essere tra 1 e 365"):
-        parse_deadline("366")
-
+from tests.helpers import (
+    TODAY,
+    assert_reply_contains,
+    bulk_add_products,
+    last_reply,
+    make_update,
+    seed_referral_pair,
+)
 
-def test_parse_deadline_gg_mm_aaaa_format():
-    """Test parse_deadline with gg-mm-aaaa date format."""
-    # Use a dynamic future date to avoid test failures as time passes
-    future_date = date.today() + timedelta(days=100)
-    date_str = future_date.strftime("%d-%m-%Y")
-    result = parse_deadline(date_str)
-    assert result == future_date
+# Deadline inputs, formatted once at import from the pinned date
+IN_30_DAYS = TODAY + timedelta(days=30)
+IN_60_DAYS = TODAY + timedelta(days=60)
+YESTERDAY_GG_MM_AAAA = (TODAY - timedelta(days=1)).strftime("%d-%m-%Y")
 
+# Answers collected by the /add conversation up to the deadline step
+PRODUCT_DRAFT = {
+    "product_name": "Test Product",
+    "product_asin": "B08N5WRWNW",
+    "product_marketplace": "it",
+    "product_price": 59.90,
+}
 
-def test_parse_deadline_gg_mm_aaaa_format_leap_year():
-    """Test parse_deadline with date format within 365 days limit."""
-    # Use a date within 365 days (e.g., 200 days from today)
-    future_date = date.today() + timedelta(days=200)
-    date_str = future_date.strftime("%d-%m-%Y")
-    result = parse_deadline(date_str)
-    assert result == future_date
 
+@pytest.fixture(scope="session")
+def bot_spec():
+    """Telegram Bot mock autospecced once per session (async methods become AsyncMock)."""
+    return create_autospec(Bot, instance=True)
 
-def test_parse_deadline_invalid_format():
-    """Test parse_deadline with invalid format."""
-    with pytest.raises(ValueError, match="Formato non valido"):
-        parse_deadline("invalid")
 
+@pytest.fixture
+def bot_mock(bot_spec):
+    """Session bot mock with calls, return values and side effects cleared."""
+    bot_spec.reset_mock(return_value=True, side_effect=True)
+    return bot_spec
 
-def test_parse_deadline_iso_format():
-    """Test parse_deadline with ISO format (yyyy-mm-dd) for /update compatibility."""
-    # Use a dynamic future date to avoid test failures as time passes
-    future_date = date.today() + timedelta(days=150)
-    date_str = future_date.strftime("%Y-%m-%d")
-    result = parse_deadline(date_str)
-    assert result == future_date
 
+@pytest.fixture
+async def seeded_referrer_pair(test_db):
+    """
+    Register a referrer and an invitee it referred, both with 6 slots.
 
-def test_parse_deadline_invalid_date():
-    """Test parse_deadline with invalid date (e.g., 32nd day)."""
-    with pytest.raises(ValueError, match="Data non valida"):
-        parse_deadline("32-13-2025")
+    Returns:
+        Tuple of (invitee user_id, referrer_id)
+    """
+    user_id = 12345
+    referrer_id = 99999
+    await seed_referral_pair(referrer_id, user_id)
+    return user_id, referrer_id
+
+
+@pytest.fixture
+def no_db():
+    """Fail if the handler reaches the database (for validation-only paths)."""
+    guard = AsyncMock(side_effect=AssertionError("should not reach the database"))
+    with (
+        patch("handlers.add.database.add_user", guard),
+        patch("handlers.add.database.add_product_atomic", guard),
+    ):
+        yield guard
+
+
+@pytest.fixture
+def db_mocks():
+    """Patch the database calls made by start_add (user with 0/3 products)."""
+    mocks = {
+        "add_user": AsyncMock(),
+        "get_user_products": AsyncMock(return_value=[]),
+        "get_user_product_limit": AsyncMock(return_value=3),
+    }
+    with patch.multiple("handlers.add.database", **mocks):
+        yield mocks
 
 
 # ============================================================================
@@ -109,87 +102,60 @@ def test_parse_deadline_invalid_date():
 # ============================================================================
 
 
-@pytest.mark.asyncio
-@patch("handlers.add.database.get_user_product_limit", new_callable=AsyncMock)
-@patch("handlers.add.database.get_user_products", new_callable=AsyncMock)
-@patch("handlers.add.database.add_user", new_callable=AsyncMock)
-async def test_start_add(mock_add_user, mock_get_products, mock_get_limit):
+async def test_start_add(db_mocks):
     """Test /add command initiates conversation when user has space."""
-    # Mock database responses (user has 0/3 products - has space)
-    mock_get_products.return_value = []
-    mock_get_limit.return_value = 3
-
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.effective_user.language_code = "it"
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
+    # Default database responses: user has 0/3 products - has space
+    update = make_update()
+    context = SimpleNamespace(user_data={})
 
     result = await start_add(update, context)
 
     # Verify database calls were made
-    mock_add_user.assert_called_once_with(user_id=123, language_code="it")
-    mock_get_products.assert_called_once_with(123)
-    mock_get_limit.assert_called_once_with(123)
+    db_mocks["add_user"].assert_called_once_with(user_id=123, language_code="it")
+    db_mocks["get_user_products"].assert_called_once_with(123)
+    db_mocks["get_user_product_limit"].assert_called_once_with(123)
 
     # Verify it asks for product name (first step in new flow)
     update.message.reply_text.assert_called_once()
-    call_args = update.message.reply_text.call_args
-    message = call_args[0][0]
-    assert "Come vuoi chiamare questo prodotto" in message
-    assert "Esempio" in message
+    assert_reply_contains(
+        update.message.reply_text, "Come vuoi chiamare questo prodotto", "Esempio"
+    )
 
     # Verify it returns the correct state
     assert result == WAITING_PRODUCT_NAME
 
 
-@pytest.mark.asyncio
-@patch("handlers.add.database.get_user_product_limit", new_callable=AsyncMock)
-@patch("handlers.add.database.get_user_products", new_callable=AsyncMock)
-@patch("handlers.add.database.add_user", new_callable=AsyncMock)
-async def test_start_add_limit_reached(mock_add_user, mock_get_products, mock_get_limit):
+async def test_start_add_limit_reached(db_mocks):
     """Test /add command blocks when user has reached product limit."""
     # Mock database responses (user has 3/3 products - limit reached)
-    mock_get_products.return_value = [
+    db_mocks["get_user_products"].return_value = [
         {"id": 1, "product_name": "Product 1"},
         {"id": 2, "product_name": "Product 2"},
         {"id": 3, "product_name": "Product 3"},
     ]
-    mock_get_limit.return_value = 3
 
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.effective_user.language_code = "it"
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
+    update = make_update()
+    context = SimpleNamespace(user_data={})
 
     result = await start_add(update, context)
 
     # Verify database calls were made
-    mock_add_user.assert_called_once_with(user_id=123, language_code="it")
-    mock_get_products.assert_called_once_with(123)
-    mock_get_limit.assert_called_once_with(123)
+    db_mocks["add_user"].assert_called_once_with(user_id=123, language_code="it")
+    db_mocks["get_user_products"].assert_called_once_with(123)
+    db_mocks["get_user_product_limit"].assert_called_once_with(123)
 
     # Verify it shows limit reached error
     update.message.reply_text.assert_called_once()
-    call_args = update.message.reply_text.call_args
-    message = call_args[0][0]
-    assert "Limite raggiunto" in message
-    assert "3/3 prodotti" in message
+    assert_reply_contains(update.message.reply_text, "Limite raggiunto", "3/3 prodotti")
 
     # Verify it ends conversation
     assert result == ConversationHandler.END
 
 
-@pytest.mark.asyncio
 async def test_handle_product_name_valid():
     """Test handling valid product name."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.text = "iPhone 15 Pro"
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.user_data = {}
+    update = make_update("iPhone 15 Pro")
+    context = SimpleNamespace(user_data={})
 
     result = await handle_product_name(update, context)
 
@@ -198,71 +164,48 @@ async def test_handle_product_name_valid():
 
     # Verify it asks for URL
     update.message.reply_text.assert_called_once()
-    call_args = update.message.reply_text.call_args
-    message = call_args[0][0]
-    assert "Nome salvato" in message
-    assert "iPhone 15 Pro" in message
-    assert "link del prodotto Amazon.it" in message
+    assert_reply_contains(
+        update.message.reply_text, "Nome salvato", "iPhone 15 Pro", "link del prodotto Amazon.it"
+    )
 
     # Verify it returns the correct state
     assert result == WAITING_URL
 
 
-@pytest.mark.asyncio
 async def test_handle_product_name_too_short():
     """Test handling product name that's too short."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.text = "ab"  # Only 2 characters
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.user_data = {}
+    update = make_update("ab")  # Only 2 characters
+    context = SimpleNamespace(user_data={})
 
     result = await handle_product_name(update, context)
 
     # Verify error message
     update.message.reply_text.assert_called_once()
-    call_args = update.message.reply_text.call_args
-    message = call_args[0][0]
-    assert "Nome troppo corto" in message
-    assert "almeno 3 caratteri" in message
+    assert_reply_contains(update.message.reply_text, "Nome troppo corto", "almeno 3 caratteri")
 
     # Verify it stays in same state
     assert result == WAITING_PRODUCT_NAME
 
 
-@pytest.mark.asyncio
 async def test_handle_product_name_too_long():
     """Test handling product name that's too long."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.text = "a" * 101  # 101 characters
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.user_data = {}
+    update = make_update("a" * 101)  # 101 characters
+    context = SimpleNamespace(user_data={})
 
     result = await handle_product_name(update, context)
 
     # Verify error message
     update.message.reply_text.assert_called_once()
-    call_args = update.message.reply_text.call_args
-    message = call_args[0][0]
-    assert "Nome troppo lungo" in message
-    assert "massimo 100 caratteri" in message
+    assert_reply_contains(update.message.reply_text, "Nome troppo lungo", "massimo 100 caratteri")
 
     # Verify it stays in same state
     assert result == WAITING_PRODUCT_NAME
 
 
-@pytest.mark.asyncio
 async def test_handle_url_valid():
     """Test handling valid Amazon.it URL."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.text = "https://amazon.it/dp/B08N5WRWNW"
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.user_data = {}
+    update = make_update("https://amazon.it/dp/B08N5WRWNW")
+    context = SimpleNamespace(user_data={})
 
     result = await handle_url(update, context)
 
@@ -272,69 +215,39 @@ async def test_handle_url_valid():
 
     # Verify it asks for price
     update.message.reply_text.assert_called_once()
-    call_args = update.message.reply_text.call_args
-    message = call_args[0][0]
-    assert "prezzo che hai pagato" in message
-    assert "B08N5WRWNW" in message
+    assert_reply_contains(update.message.reply_text, "prezzo che hai pagato", "B08N5WRWNW")
 
     # Verify it returns the correct state
     assert result == WAITING_PRICE
 
 
-@pytest.mark.asyncio
-async def test_handle_url_invalid_marketplace():
-    """Test handling URL from non-.it marketplace."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.text = "https://amazon.com/dp/B08N5WRWNW"
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.user_data = {}
-
-    result = await handle_url(update, context)
-
-    # Verify error message
-    update.message.reply_text.assert_called_once()
-    call_args = update.message.reply_text.call_args
-    message = call_args[0][0]
-    assert "URL non valido" in message or "Marketplace non supportato" in message
-    assert "Amazon.it" in message
-
-    # Verify it stays in same state
-    assert result == WAITING_URL
-
-
-@pytest.mark.asyncio
-async def test_handle_url_invalid():
-    """Test handling invalid URL."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.text = "https://google.com"
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.user_data = {}
+@pytest.mark.parametrize(
+    "text",
+    [
+        "https://amazon.com/dp/B08N5WRWNW",  # Non-.it marketplace
+        "https://google.com",  # Not an Amazon URL
+    ],
+)
+async def test_handle_url_invalid(text):
+    """Test handling URLs that are not from Amazon.it."""
+    update = make_update(text)
+    context = SimpleNamespace(user_data={})
 
     result = await handle_url(update, context)
 
     # Verify error message
     update.message.reply_text.assert_called_once()
-    call_args = update.message.reply_text.call_args
-    message = call_args[0][0]
-    assert "URL non valido" in message
+    assert_reply_contains(update.message.reply_text, "URL non valido", "Amazon.it")
 
     # Verify it stays in same state
     assert result == WAITING_URL
 
 
-@pytest.mark.asyncio
-async def test_handle_price_valid():
-    """Test handling valid price."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.text = "59.90"
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.user_data = {}
+@pytest.mark.parametrize("text", ["59.90", "59,90"])
+async def test_handle_price_valid(text):
+    """Test handling valid prices, with dot or comma as decimal separator."""
+    update = make_update(text)
+    context = SimpleNamespace(user_data={})
 
     result = await handle_price(update, context)
 
@@ -343,448 +256,158 @@ async def test_handle_price_valid():
 
     # Verify it asks for deadline
     update.message.reply_text.assert_called_once()
-    call_args = update.message.reply_text.call_args
-    message = call_args[0][0]
-    assert "scadenza del reso" in message
-    assert "59.90" in message
+    assert_reply_contains(update.message.reply_text, "scadenza del reso", "59.90")
 
     # Verify it returns the correct state
     assert result == WAITING_DEADLINE
 
 
-@pytest.mark.asyncio
-async def test_handle_price_comma_separator():
-    """Test handling price with comma as decimal separator."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.text = "59,90"
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.user_data = {}
-
-    result = await handle_price(update, context)
-
-    # Verify price was stored correctly
-    assert context.user_data["product_price"] == 59.90
-    assert result == WAITING_DEADLINE
-
-
-@pytest.mark.asyncio
-async def test_handle_price_invalid():
-    """Test handling invalid price."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.text = "invalid"
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.user_data = {}
+@pytest.mark.parametrize(
+    "text, error",
+    [
+        ("invalid", "Prezzo non valido"),
+        ("-10", "Prezzo non valido"),
+        ("12345678901234567.99", "Prezzo troppo lungo"),  # 19 digits total
+    ],
+)
+async def test_handle_price_invalid(text, error):
+    """Test handling invalid prices."""
+    update = make_update(text)
+    context = SimpleNamespace(user_data={})
 
     result = await handle_price(update, context)
 
     # Verify error message
     update.message.reply_text.assert_called_once()
-    call_args = update.message.reply_text.call_args
-    message = call_args[0][0]
-    assert "Prezzo non valido" in message
+    assert_reply_contains(update.message.reply_text, error)
 
     # Verify it stays in same state
     assert result == WAITING_PRICE
 
 
-@pytest.mark.asyncio
-async def test_handle_price_negative():
-    """Test handling negative price."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.text = "-10"
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.user_data = {}
-
-    result = await handle_price(update, context)
-
-    # Verify error message
-    call_args = update.message.reply_text.call_args
-    message = call_args[0][0]
-    assert "Prezzo non valido" in message
-
-    # Verify it stays in same state
-    assert result == WAITING_PRICE
-
-
-@pytest.mark.asyncio
-async def test_handle_price_too_many_digits():
-    """Test handling price with more than 16 digits."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.text = "12345678901234567.99"  # 19 digits total
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.user_data = {}
-
-    result = await handle_price(update, context)
-
-    # Verify error message
-    call_args = update.message.reply_text.call_args
-    message = call_args[0][0]
-    assert "Prezzo troppo lungo" in message or "16 cifre" in message
-
-    # Verify it stays in same state
-    assert result == WAITING_PRICE
-
-
-@pytest.mark.asyncio
-async def test_handle_deadline_days(test_db):
-    """Test handling deadline as number of days."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.effective_user.language_code = "it"
-    update.message.text = "30"
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.user_data = {
-        "product_name": "Test Product",
-        "product_asin": "B08N5WRWNW",
-        "product_marketplace": "it",
-        "product_price": 59.90,
-    }
+@pytest.mark.parametrize(
+    "text, expected_deadline",
+    [("30", IN_30_DAYS), (IN_60_DAYS.strftime("%d-%m-%Y"), IN_60_DAYS)],
+    ids=["days", "gg-mm-aaaa"],
+)
+async def test_handle_deadline_valid(text, expected_deadline):
+    """Test handling deadline as number of days or as gg-mm-aaaa date."""
+    update = make_update(text)
+    context = SimpleNamespace(user_data=dict(PRODUCT_DRAFT))
 
     result = await handle_deadline(update, context)
 
     # Verify deadline was stored
-    expected_deadline = date.today() + timedelta(days=30)
     assert context.user_data["product_deadline"] == expected_deadline
 
     # Verify it asks for min savings (new step)
-    call_args = update.message.reply_text.call_args
-    message = call_args[0][0]
-    assert "risparmio minimo" in message
-
-    # Verify conversation continues to min savings step
-    assert result == WAITING_MIN_SAVINGS
-
-
-@pytest.mark.asyncio
-async def test_handle_deadline_date_format(test_db):
-    """Test handling deadline as gg-mm-aaaa date."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.effective_user.language_code = "it"
-    # Use a future date
-    future_date = date.today() + timedelta(days=60)
-    update.message.text = future_date.strftime("%d-%m-%Y")
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.user_data = {
-        "product_name": "Test Product",
-        "product_asin": "B08N5WRWNW",
-        "product_marketplace": "it",
-        "product_price": 59.90,
-    }
-
-    result = await handle_deadline(update, context)
-
-    # Verify deadline was stored
-    assert context.user_data["product_deadline"] == future_date
-
-    # Verify it asks for min savings
-    call_args = update.message.reply_text.call_args
-    message = call_args[0][0]
-    assert "risparmio minimo" in message
+    assert_reply_contains(update.message.reply_text, "risparmio minimo")
 
     # Verify conversation continues to min savings step
     assert result == WAITING_MIN_SAVINGS
 
 
-@pytest.mark.asyncio
-async def test_handle_deadline_invalid(test_db):
+async def test_handle_deadline_invalid():
     """Test handling invalid deadline."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.text = "invalid"
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.user_data = {
-        "product_name": "Test Product",
-        "product_asin": "B08N5WRWNW",
-        "product_marketplace": "it",
-        "product_price": 59.90,
-    }
+    update = make_update("invalid")
+    context = SimpleNamespace(user_data=dict(PRODUCT_DRAFT))
 
     result = await handle_deadline(update, context)
 
     # Verify error message
-    call_args = update.message.reply_text.call_args
-    message = call_args[0][0]
-    assert "Scadenza non valida" in message
+    assert_reply_contains(update.message.reply_text, "Scadenza non valida")
 
     # Verify it stays in same state
     assert result == WAITING_DEADLINE
 
 
-@pytest.mark.asyncio
-async def test_handle_deadline_past_date(test_db):
+async def test_handle_deadline_past_date():
     """Test handling deadline in the past."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    yesterday = date.today() - timedelta(days=1)
-    update.message.text = yesterday.strftime("%d-%m-%Y")
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.user_data = {
-        "product_name": "Test Product",
-        "product_asin": "B08N5WRWNW",
-        "product_marketplace": "it",
-        "product_price": 59.90,
-    }
+    update = make_update(YESTERDAY_GG_MM_AAAA)
+    context = SimpleNamespace(user_data=dict(PRODUCT_DRAFT))
 
     result = await handle_deadline(update, context)
 
     # Verify error message
-    call_args = update.message.reply_text.call_args
-    message = call_args[0][0]
-    assert "nel passato" in message
+    assert_reply_contains(update.message.reply_text, "nel passato")
 
     # Verify it stays in same state
     assert result == WAITING_DEADLINE
 
 
-@pytest.mark.asyncio
-async def test_handle_min_savings_valid(test_db):
-    """Test handling valid min savings threshold."""
-    user_id = 123
-    tomorrow = date.today() + timedelta(days=1)
-
-    # Setup user and context with stored data
-    await database.add_user(user_id=user_id, language_code="it")
-
-    update = MagicMock()
-    update.effective_user.id = user_id
-    update.effective_user.language_code = "it"  # Set to string, not MagicMock
-    update.message.text = "5.00"
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.user_data = {
-        "product_name": "Test Product",
-        "product_asin": "B08N5WRWNW",
-        "product_marketplace": "it",
-        "product_price": 59.90,
-        "product_deadline": tomorrow,
-    }
+@pytest.mark.parametrize(
+    "text, threshold, needles",
+    [
+        ("5.00", 5.00, ("Test Product", "€5.00")),
+        ("0", 0.0, ("Test Product", "qualsiasi risparmio")),  # Any price drop
+    ],
+)
+async def test_handle_min_savings_valid(seeded_user, tomorrow, text, threshold, needles):
+    """Test handling valid min savings thresholds, including 0 (any price drop)."""
+    user_id = seeded_user
+    update = make_update(text, user_id=user_id)
+    context = SimpleNamespace(user_data={**PRODUCT_DRAFT, "product_deadline": tomorrow})
 
     result = await handle_min_savings(update, context)
 
     # Verify product was added
     products = await database.get_user_products(user_id)
     assert len(products) == 1
-    assert products[0]["min_savings_threshold"] == 5.00
+    assert products[0]["min_savings_threshold"] == threshold
 
     # Verify success message
     update.message.reply_text.assert_called_once()
-    call_args = update.message.reply_text.call_args
-    message = call_args[0][0]
-    assert "Prodotto aggiunto con successo" in message
-    assert "Test Product" in message
-    assert "€5.00" in message
+    assert_reply_contains(update.message.reply_text, "Prodotto aggiunto con successo", *needles)
 
     # Verify conversation ended
     assert result == ConversationHandler.END
 
 
-@pytest.mark.asyncio
-async def test_handle_min_savings_zero(test_db):
-    """Test handling min savings of 0 (any price drop)."""
-    user_id = 123
-    tomorrow = date.today() + timedelta(days=1)
-
-    # Setup user and context with stored data
-    await database.add_user(user_id=user_id, language_code="it")
-
-    update = MagicMock()
-    update.effective_user.id = user_id
-    update.effective_user.language_code = "it"  # Set to string, not MagicMock
-    update.message.text = "0"
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.user_data = {
-        "product_name": "Test Product",
-        "product_asin": "B08N5WRWNW",
-        "product_marketplace": "it",
-        "product_price": 59.90,
-        "product_deadline": tomorrow,
-    }
-
-    result = await handle_min_savings(update, context)
-
-    # Verify product was added with 0 threshold
-    products = await database.get_user_products(user_id)
-    assert len(products) == 1
-    assert products[0]["min_savings_threshold"] == 0.0
-
-    # Verify success message mentions "qualsiasi risparmio"
-    call_args = update.message.reply_text.call_args
-    message = call_args[0][0]
-    assert "qualsiasi risparmio" in message
-
-    assert result == ConversationHandler.END
-
-
-@pytest.mark.asyncio
-async def test_handle_min_savings_negative(test_db):
-    """Test handling negative min savings (invalid)."""
-    user_id = 123
-    tomorrow = date.today() + timedelta(days=1)
-
-    await database.add_user(user_id=user_id, language_code="it")
-
-    update = MagicMock()
-    update.effective_user.id = user_id
-    update.effective_user.language_code = "it"  # Set to string, not MagicMock
-    update.message.text = "-5"
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.user_data = {
-        "product_name": "Test Product",
-        "product_asin": "B08N5WRWNW",
-        "product_marketplace": "it",
-        "product_price": 59.90,
-        "product_deadline": tomorrow,
-    }
-
-    result = await handle_min_savings(update, context)
-
-    # Verify error message
-    call_args = update.message.reply_text.call_args
-    message = call_args[0][0]
-    assert "Valore non valido" in message
-    assert "non negativo" in message
-
-    # Verify product was NOT added
-    products = await database.get_user_products(user_id)
-    assert len(products) == 0
-
-    # Verify it stays in same state
-    assert result == WAITING_MIN_SAVINGS
-
-
-@pytest.mark.asyncio
-async def test_handle_min_savings_too_high(test_db):
-    """Test handling min savings >= price paid (invalid)."""
-    user_id = 123
-    tomorrow = date.today() + timedelta(days=1)
-
-    await database.add_user(user_id=user_id, language_code="it")
-
-    update = MagicMock()
-    update.effective_user.id = user_id
-    update.effective_user.language_code = "it"  # Set to string, not MagicMock
-    update.message.text = "60"  # Higher than price paid
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.user_data = {
-        "product_name": "Test Product",
-        "product_asin": "B08N5WRWNW",
-        "product_marketplace": "it",
-        "product_price": 59.90,
-        "product_deadline": tomorrow,
-    }
-
-    result = await handle_min_savings(update, context)
-
-    # Verify error message
-    call_args = update.message.reply_text.call_args
-    message = call_args[0][0]
-    assert "Valore troppo alto" in message
-    assert "inferiore al prezzo pagato" in message
-
-    # Verify product was NOT added
-    products = await database.get_user_products(user_id)
-    assert len(products) == 0
-
-    # Verify it stays in same state
-    assert result == WAITING_MIN_SAVINGS
-
-
-@pytest.mark.asyncio
-async def test_handle_min_savings_invalid_format(test_db):
-    """Test handling invalid min savings format."""
-    user_id = 123
-    tomorrow = date.today() + timedelta(days=1)
-
-    await database.add_user(user_id=user_id, language_code="it")
-
-    update = MagicMock()
-    update.effective_user.id = user_id
-    update.effective_user.language_code = "it"  # Set to string, not MagicMock
-    update.message.text = "abc"  # Not a number
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.user_data = {
-        "product_name": "Test Product",
-        "product_asin": "B08N5WRWNW",
-        "product_marketplace": "it",
-        "product_price": 59.90,
-        "product_deadline": tomorrow,
-    }
+@pytest.mark.parametrize(
+    "text, errors",
+    [
+        ("-5", ("Valore non valido", "non negativo")),
+        ("60", ("Valore troppo alto", "inferiore al prezzo pagato")),  # Higher than price paid
+        ("abc", ("Valore non valido", "abc")),  # Not a number
+    ],
+)
+async def test_handle_min_savings_invalid(no_db, text, errors, tomorrow):
+    """Test handling invalid min savings (negative, >= price paid, not a number)."""
+    update = make_update(text)
+    context = SimpleNamespace(user_data={**PRODUCT_DRAFT, "product_deadline": tomorrow})
 
     result = await handle_min_savings(update, context)
 
     # Verify error message
-    call_args = update.message.reply_text.call_args
-    message = call_args[0][0]
-    assert "Valore non valido" in message
-    assert "abc" in message
+    assert_reply_contains(update.message.reply_text, *errors)
 
     # Verify product was NOT added
-    products = await database.get_user_products(user_id)
-    assert len(products) == 0
+    no_db.assert_not_called()
 
     # Verify it stays in same state
     assert result == WAITING_MIN_SAVINGS
 
 
-@pytest.mark.asyncio
-async def test_handle_min_savings_product_limit(test_db):
+async def test_handle_min_savings_product_limit(seeded_user, tomorrow):
     """Test adding product when limit is reached."""
-    user_id = 123
-    tomorrow = date.today() + timedelta(days=1)
-
-    # Add user with initial limit (5 products)
-    await database.add_user(user_id, "it")
+    user_id = seeded_user
+    # Set initial limit (5 products)
     await database.set_user_max_products(user_id, database.INITIAL_MAX_PRODUCTS)
 
     # Add INITIAL_MAX_PRODUCTS products (reach the limit)
-    for i in range(database.INITIAL_MAX_PRODUCTS):
-        await database.add_product(
-            user_id=user_id,
-            product_name=f"Product {i}",
-            asin=f"B08N5WRWN{i}",
-            marketplace="it",
-            price_paid=50.00 + i,
-            return_deadline=tomorrow,
-        )
-
-    update = MagicMock()
-    update.effective_user.id = user_id
-    update.effective_user.language_code = "it"
-    update.message.text = "5.00"
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.user_data = {
-        "product_name": "Test Product",
-        "product_asin": "B08N5WRWNW",
-        "product_marketplace": "it",
-        "product_price": 59.90,
-        "product_deadline": tomorrow,
-    }
+    await bulk_add_products(user_id, database.INITIAL_MAX_PRODUCTS, tomorrow)
+
+    update = make_update("5.00", user_id=user_id)
+    context = SimpleNamespace(user_data={**PRODUCT_DRAFT, "product_deadline": tomorrow})
 
     result = await handle_min_savings(update, context)
 
     # Verify error message
-    call_args = update.message.reply_text.call_args
-    message = call_args[0][0]
-    assert "Limite raggiunto" in message
-    assert f"{database.INITIAL_MAX_PRODUCTS}/{database.INITIAL_MAX_PRODUCTS} prodotti" in message
+    assert_reply_contains(
+        update.message.reply_text,
+        "Limite raggiunto",
+        f"{database.INITIAL_MAX_PRODUCTS}/{database.INITIAL_MAX_PRODUCTS} prodotti",
+    )
 
     # Verify conversation ended
     assert result == ConversationHandler.END
@@ -794,26 +417,16 @@ async def test_handle_min_savings_product_limit(test_db):
     assert len(products) == database.INITIAL_MAX_PRODUCTS
 
 
-@pytest.mark.asyncio
 async def test_cancel():
     """Test /cancel command."""
-    update = MagicMock()
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.user_data = {
-        "product_name": "Test Product",
-        "product_asin": "B08N5WRWNW",
-        "product_marketplace": "it",
-        "product_price": 59.90,
-    }
+    update = make_update()
+    context = SimpleNamespace(user_data=dict(PRODUCT_DRAFT))
 
     result = await cancel(update, context)
 
     # Verify cancel message
     update.message.reply_text.assert_called_once()
-    call_args = update.message.reply_text.call_args
-    message = call_args[0][0]
-    assert "annullata" in message
+    assert_reply_contains(update.message.reply_text, "annullata")
 
     # Verify conversation ended
     assert result == ConversationHandler.END
@@ -822,142 +435,89 @@ async def test_cancel():
     assert context.user_data == {}
 
 
-@pytest.mark.asyncio
-async def test_handle_min_savings_database_error(test_db):
+async def test_handle_min_savings_database_error(test_db, today, monkeypatch):
     """Test handling database error gracefully."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.effective_user.language_code = "it"
-    update.message.text = "5.00"
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.user_data = {
-        "product_name": "Test Product",
-        "product_asin": "B08N5WRWNW",
-        "product_marketplace": "it",
-        "product_price": 59.90,
-        "product_deadline": date.today() + timedelta(days=30),
-    }
+    update = make_update("5.00")
+    context = SimpleNamespace(
+        user_data={**PRODUCT_DRAFT, "product_deadline": today + timedelta(days=30)}
+    )
+
+    # Make database.add_product_atomic raise an exception
+    monkeypatch.setattr(
+        database, "add_product_atomic", AsyncMock(side_effect=Exception("DB Error"))
+    )
+
+    result = await handle_min_savings(update, context)
 
-    # Mock database.add_product_atomic to raise an exception
-    with patch("handlers.add.database.add_product_atomic", side_effect=Exception("DB Error")):
-        result = await handle_min_savings(update, context)
+    # Verify error message was sent
+    assert_reply_contains(update.message.reply_text, "Errore")
+
+    # Verify conversation ended
+    assert result == ConversationHandler.END
 
-        # Verify error message was sent
-        call_args = update.message.reply_text.call_args
-        message = call_args[0][0]
-        assert "Errore" in message
 
-        # Verify conversation ended
-        assert result == ConversationHandler.END
+def _patch_add_product_checks(monkeypatch, add_product_error: Exception) -> None:
+    """Patch the database calls of handle_min_savings for a user with 0/3 products."""
+    monkeypatch.setattr(database, "add_user", AsyncMock())
+    monkeypatch.setattr(database, "get_user_products", AsyncMock(return_value=[]))
+    monkeypatch.setattr(database, "get_user_product_limit", AsyncMock(return_value=3))
+    monkeypatch.setattr(database, "add_product_atomic", AsyncMock(side_effect=add_product_error))
 
 
-@pytest.mark.asyncio
-async def test_handle_min_savings_product_limit_trigger(test_db):
+async def test_handle_min_savings_product_limit_trigger(today, monkeypatch):
     """Test handling product limit exceeded error from database trigger."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.effective_user.language_code = "it"
-    update.message.text = "5.00"
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.user_data = {
-        "product_name": "Test Product",
-        "product_asin": "B08N5WRWNW",
-        "product_marketplace": "it",
-        "product_price": 59.90,
-        "product_deadline": date.today() + timedelta(days=30),
-    }
+    update = make_update("5.00")
+    context = SimpleNamespace(
+        user_data={**PRODUCT_DRAFT, "product_deadline": today + timedelta(days=30)}
+    )
+
+    # add_product_atomic raises IntegrityError with trigger message
+    _patch_add_product_checks(monkeypatch, aiosqlite.IntegrityError("Product limit exceeded"))
+
+    result = await handle_min_savings(update, context)
+
+    # Verify user-friendly error message was sent
+    assert_reply_contains(update.message.reply_text, "Limite prodotti raggiunto")
+    assert update.message.reply_text.call_args.kwargs["parse_mode"] == "HTML"
 
-    # Mock database functions
-    with patch("handlers.add.database.add_user", new_callable=AsyncMock):
-        with patch("handlers.add.database.get_user_products", return_value=[]):
-            with patch("handlers.add.database.get_user_product_limit", return_value=3):
-                # Mock add_product_atomic to raise IntegrityError with trigger message
-                with patch(
-                    "handlers.add.database.add_product_atomic",
-                    side_effect=aiosqlite.IntegrityError("Product limit exceeded"),
-                ):
-                    result = await handle_min_savings(update, context)
-
-                    # Verify user-friendly error message was sent
-                    call_args = update.message.reply_text.call_args
-                    message = call_args[0][0]
-                    assert "Limite prodotti raggiunto" in message
-                    assert "parse_mode" in call_args[1]
-                    assert call_args[1]["parse_mode"] == "HTML"
-
-                    # Verify conversation ended
-                    assert result == ConversationHandler.END
-
-
-@pytest.mark.asyncio
-async def test_handle_min_savings_other_integrity_error(test_db):
+    # Verify conversation ended
+    assert result == ConversationHandler.END
+
+
+async def test_handle_min_savings_other_integrity_error(today, monkeypatch):
     """Test handling other IntegrityError (not product limit)."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.effective_user.language_code = "it"
-    update.message.text = "5.00"
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.user_data = {
-        "product_name": "Test Product",
-        "product_asin": "B08N5WRWNW",
-        "product_marketplace": "it",
-        "product_price": 59.90,
-        "product_deadline": date.today() + timedelta(days=30),
-    }
+    update = make_update("5.00")
+    context = SimpleNamespace(
+        user_data={**PRODUCT_DRAFT, "product_deadline": today + timedelta(days=30)}
+    )
 
-    # Mock database functions
-    with patch("handlers.add.database.add_user", new_callable=AsyncMock):
-        with patch("handlers.add.database.get_user_products", return_value=[]):
-            with patch("handlers.add.database.get_user_product_limit", return_value=3):
-                # Mock add_product_atomic to raise IntegrityError with different message
-                with patch(
-                    "handlers.add.database.add_product_atomic",
-                    side_effect=aiosqlite.IntegrityError("FOREIGN KEY constraint failed"),
-                ):
-                    result = await handle_min_savings(update, context)
-
-                    # Verify generic error message was sent
-                    call_args = update.message.reply_text.call_args
-                    message = call_args[0][0]
-                    assert "Errore" in message
-                    assert "Riprova più tardi" in message
-
-                    # Verify conversation ended
-                    assert result == ConversationHandler.END
-
-
-@pytest.mark.asyncio
-async def test_handle_min_savings_first_product_gives_referral_bonus(test_db):
-    """Test that adding first product gives bonus to referrer."""
-    user_id = 12345
-    referrer_id = 99999
+    # add_product_atomic raises IntegrityError with different message
+    _patch_add_product_checks(
+        monkeypatch, aiosqlite.IntegrityError("FOREIGN KEY constraint failed")
+    )
+
+    result = await handle_min_savings(update, context)
+
+    # Verify generic error message was sent
+    assert_reply_contains(update.message.reply_text, "Errore", "Riprova più tardi")
+
+    # Verify conversation ended
+    assert result == ConversationHandler.END
 
-    # Add referrer and invitee
-    await database.add_user(referrer_id, "it")
-    await database.set_user_max_products(referrer_id, 6)  # Referrer has 6 slots
-    await database.add_user(user_id, "it", referred_by=referrer_id)
-    await database.set_user_max_products(user_id, 6)
+
+async def test_handle_min_savings_first_product_gives_referral_bonus(
+    seeded_referrer_pair, today, bot_mock
+):
+    """Test that adding first product gives bonus to referrer."""
+    user_id, referrer_id = seeded_referrer_pair  # Referrer has 6 slots
 
     # Mock update and context
-    update = MagicMock()
-    update.effective_user.id = user_id
-    update.effective_user.language_code = "it"
-    update.message.text = "5.00"
-    update.message.reply_text = AsyncMock()
-
-    context = MagicMock()
-    context.user_data = {
-        "product_name": "Test Product",
-        "product_asin": "B08N5WRWNW",
-        "product_marketplace": "it",
-        "product_price": 59.90,
-        "product_deadline": date.today() + timedelta(days=30),
-    }
-    context.bot = MagicMock()
-    context.bot.send_message = AsyncMock()
+    update = make_update("5.00", user_id=user_id)
+
+    context = SimpleNamespace(
+        user_data={**PRODUCT_DRAFT, "product_deadline": today + timedelta(days=30)}
+    )
+    context.bot = bot_mock
 
     # Add product (first one)
     result = await handle_min_savings(update, context)
@@ -985,35 +545,24 @@ async def test_handle_min_savings_first_product_gives_referral_bonus(test_db):
     assert "9/21" in notification
 
 
-@pytest.mark.asyncio
-async def test_handle_min_savings_referrer_at_cap_no_notification(test_db):
+async def test_handle_min_savings_referrer_at_cap_no_notification(
+    seeded_referrer_pair, today, bot_mock
+):
     """Test that referrer at 21 slots doesn't get notified."""
-    user_id = 12345
-    referrer_id = 99999
-
-    # Add referrer at cap and invitee
-    await database.add_user(referrer_id, "it")
-    await database.set_user_max_products(referrer_id, 21)  # Already at cap
-    await database.add_user(user_id, "it", referred_by=referrer_id)
-    await database.set_user_max_products(user_id, 6)
+    user_id, referrer_id = seeded_referrer_pair
+    await database.set_user_max_products(referrer_id, 21)  # Referrer already at cap
 
     # Mock update and context
-    update = MagicMock()
-    update.effective_user.id = user_id
-    update.effective_user.language_code = "it"
-    update.message.text = "0"
-    update.message.reply_text = AsyncMock()
-
-    context = MagicMock()
-    context.user_data = {
-        "product_name": "Test Product",
-        "product_asin": "B08N5WRWNW",
-        "product_marketplace": "it",
-        "product_price": 50.00,
-        "product_deadline": date.today() + timedelta(days=20),
-    }
-    context.bot = MagicMock()
-    context.bot.send_message = AsyncMock()
+    update = make_update("0", user_id=user_id)
+
+    context = SimpleNamespace(
+        user_data={
+            **PRODUCT_DRAFT,
+            "product_price": 50.00,
+            "product_deadline": today + timedelta(days=20),
+        }
+    )
+    context.bot = bot_mock
 
     # Add product
     result = await handle_min_savings(update, context)
@@ -1033,8 +582,7 @@ async def test_handle_min_savings_referrer_at_cap_no_notification(test_db):
     context.bot.send_message.assert_not_called()
 
 
-@pytest.mark.asyncio
-async def test_handle_min_savings_referrer_deleted_no_crash(test_db):
+async def test_handle_min_savings_referrer_deleted_no_crash(test_db, today, bot_mock):
     """Test that deleted referrer doesn't crash product addition."""
     user_id = 12345
     referrer_id = 99999
@@ -1044,22 +592,16 @@ async def test_handle_min_savings_referrer_deleted_no_crash(test_db):
     await database.set_user_max_products(user_id, 6)
 
     # Mock update and context
-    update = MagicMock()
-    update.effective_user.id = user_id
-    update.effective_user.language_code = "it"
-    update.message.text = "0"
-    update.message.reply_text = AsyncMock()
-
-    context = MagicMock()
-    context.user_data = {
-        "product_name": "Test Product",
-        "product_asin": "B08N5WRWNW",
-        "product_marketplace": "it",
-        "product_price": 50.00,
-        "product_deadline": date.today() + timedelta(days=20),
-    }
-    context.bot = MagicMock()
-    context.bot.send_message = AsyncMock()
+    update = make_update("0", user_id=user_id)
+
+    context = SimpleNamespace(
+        user_data={
+            **PRODUCT_DRAFT,
+            "product_price": 50.00,
+            "product_deadline": today + timedelta(days=20),
+        }
+    )
+    context.bot = bot_mock
 
     # Add product (should not crash)
     result = await handle_min_savings(update, context)
@@ -1070,36 +612,25 @@ async def test_handle_min_savings_referrer_deleted_no_crash(test_db):
     assert len(products) == 1
 
 
-@pytest.mark.asyncio
-async def test_handle_min_savings_notification_failure_doesnt_block(test_db):
+async def test_handle_min_savings_notification_failure_doesnt_block(
+    seeded_referrer_pair, today, bot_mock
+):
     """Test that notification failure doesn't block product addition."""
-    user_id = 12345
-    referrer_id = 99999
-
-    # Add referrer and invitee
-    await database.add_user(referrer_id, "it")
-    await database.set_user_max_products(referrer_id, 6)
-    await database.add_user(user_id, "it", referred_by=referrer_id)
-    await database.set_user_max_products(user_id, 6)
+    user_id, referrer_id = seeded_referrer_pair
 
     # Mock update and context
-    update = MagicMock()
-    update.effective_user.id = user_id
-    update.effective_user.language_code = "it"
-    update.message.text = "0"
-    update.message.reply_text = AsyncMock()
-
-    context = MagicMock()
-    context.user_data = {
-        "product_name": "Test Product",
-        "product_asin": "B08N5WRWNW",
-        "product_marketplace": "it",
-        "product_price": 50.00,
-        "product_deadline": date.today() + timedelta(days=20),
-    }
-    context.bot = MagicMock()
-    # Mock send_message to raise exception
-    context.bot.send_message = AsyncMock(side_effect=Exception("Bot blocked"))
+    update = make_update("0", user_id=user_id)
+
+    context = SimpleNamespace(
+        user_data={
+            **PRODUCT_DRAFT,
+            "product_price": 50.00,
+            "product_deadline": today + timedelta(days=20),
+        }
+    )
+    context.bot = bot_mock
+    # Make send_message raise exception
+    bot_mock.send_message.side_effect = Exception("Bot blocked")
 
     # Add product (should not crash despite notification failure)
     result = await handle_min_savings(update, context)
@@ -1118,17 +649,9 @@ async def test_handle_min_savings_notification_failure_doesnt_block(test_db):
     assert user["referral_bonus_given"] is True or user["referral_bonus_given"] == 1
 
 
-@pytest.mark.asyncio
-async def test_handle_min_savings_second_product_no_bonus(test_db):
+async def test_handle_min_savings_second_product_no_bonus(seeded_referrer_pair, today, bot_mock):
     """Test that second product doesn't give bonus again."""
-    user_id = 12345
-    referrer_id = 99999
-
-    # Add referrer and invitee
-    await database.add_user(referrer_id, "it")
-    await database.set_user_max_products(referrer_id, 6)
-    await database.add_user(user_id, "it", referred_by=referrer_id)
-    await database.set_user_max_products(user_id, 6)
+    user_id, referrer_id = seeded_referrer_pair
 
     # Add first product
     await database.add_product(
@@ -1137,28 +660,24 @@ async def test_handle_min_savings_second_product_no_bonus(test_db):
         asin="B08N5WRWN1",
         marketplace="it",
         price_paid=50.00,
-        return_deadline=date.today() + timedelta(days=30),
+        return_deadline=today + timedelta(days=30),
     )
     # Mark bonus as given
     await database.mark_referral_bonus_given(user_id)
 
     # Mock update and context for second product
-    update = MagicMock()
-    update.effective_user.id = user_id
-    update.effective_user.language_code = "it"
-    update.message.text = "0"
-    update.message.reply_text = AsyncMock()
-
-    context = MagicMock()
-    context.user_data = {
-        "product_name": "Second Product",
-        "product_asin": "B08N5WRWN2",
-        "product_marketplace": "it",
-        "product_price": 40.00,
-        "product_deadline": date.today() + timedelta(days=25),
-    }
-    context.bot = MagicMock()
-    context.bot.send_message = AsyncMock()
+    update = make_update("0", user_id=user_id)
+
+    context = SimpleNamespace(
+        user_data={
+            "product_name": "Second Product",
+            "product_asin": "B08N5WRWN2",
+            "product_marketplace": "it",
+            "product_price": 40.00,
+            "product_deadline": today + timedelta(days=25),
+        }
+    )
+    context.bot = bot_mock
 
     # Add second product
     result = await handle_min_savings(update, context)
@@ -1176,42 +695,27 @@ async def test_handle_min_savings_second_product_no_bonus(test_db):
     context.bot.send_message.assert_not_called()
 
 
-@pytest.mark.asyncio
-async def test_handle_min_savings_shows_share_hint_when_low_on_slots(test_db):
+async def test_handle_min_savings_shows_share_hint_when_low_on_slots(seeded_user, tomorrow):
     """Test /add shows /share hint when user has <3 slots available after adding."""
-    user_id = 123
-    tomorrow = date.today() + timedelta(days=1)
-
-    # Create user with 6 slots and 4 existing products
-    await database.add_user(user_id, "it")
+    user_id = seeded_user
+    # Give user 6 slots and 4 existing products
     await database.set_user_max_products(user_id, 6)
 
     # Add 4 products
-    for i in range(4):
-        await database.add_product(
-            user_id=user_id,
-            product_name=f"Product {i + 1}",
-            asin=f"ASIN0000{i + 1}",
-            marketplace="it",
-            price_paid=50.0,
-            return_deadline=tomorrow,
-        )
+    await bulk_add_products(user_id, 4, tomorrow)
 
     # Mock update and context for 5th product (will leave only 1 slot)
-    update = MagicMock()
-    update.effective_user.id = user_id
-    update.effective_user.language_code = "it"
-    update.message.text = "0"
-    update.message.reply_text = AsyncMock()
-
-    context = MagicMock()
-    context.user_data = {
-        "product_name": "Fifth Product",
-        "product_asin": "B08N5WRWN5",
-        "product_marketplace": "it",
-        "product_price": 60.00,
-        "product_deadline": tomorrow,
-    }
+    update = make_update("0", user_id=user_id)
+
+    context = SimpleNamespace(
+        user_data={
+            "product_name": "Fifth Product",
+            "product_asin": "B08N5WRWN5",
+            "product_marketplace": "it",
+            "product_price": 60.00,
+            "product_deadline": tomorrow,
+        }
+    )
 
     # Add 5th product
     result = await handle_min_savings(update, context)
@@ -1234,14 +738,10 @@ async def test_handle_min_savings_shows_share_hint_when_low_on_slots(test_db):
     assert "Stai esaurendo gli slot" in message
 
 
-@pytest.mark.asyncio
-async def test_handle_min_savings_no_share_hint_when_enough_slots(test_db):
+async def test_handle_min_savings_no_share_hint_when_enough_slots(seeded_user, tomorrow):
     """Test /add doesn't show /share hint when user has ≥3 slots available."""
-    user_id = 123
-    tomorrow = date.today() + timedelta(days=1)
-
-    # Create user with 6 slots and 1 existing product
-    await database.add_user(user_id, "it")
+    user_id = seeded_user
+    # Give user 6 slots and 1 existing product
     await database.set_user_max_products(user_id, 6)
 
     # Add 1 product
@@ -1255,20 +755,17 @@ async def test_handle_min_savings_no_share_hint_when_enough_slots(test_db):
     )
 
     # Mock update and context for 2nd product (will leave 4 slots)
-    update = MagicMock()
-    update.effective_user.id = user_id
-    update.effective_user.language_code = "it"
-    update.message.text = "0"
-    update.message.reply_text = AsyncMock()
-
-    context = MagicMock()
-    context.user_data = {
-        "product_name": "Second Product",
-        "product_asin": "B08N5WRWN2",
-        "product_marketplace": "it",
-        "product_price": 60.00,
-        "product_deadline": tomorrow,
-    }
+    update = make_update("0", user_id=user_id)
+
+    context = SimpleNamespace(
+        user_data={
+            "product_name": "Second Product",
+            "product_asin": "B08N5WRWN2",
+            "product_marketplace": "it",
+            "product_price": 60.00,
+            "product_deadline": tomorrow,
+        }
+    )
 
     # Add 2nd product
     result = await handle_min_savings(update, context)
@@ -1282,50 +779,34 @@ async def test_handle_min_savings_no_share_hint_when_enough_slots(test_db):
     assert update.message.reply_text.call_count == 1
 
     # Verify it's the success message
-    call_args = update.message.reply_text.call_args
-    message = call_args[0][0]
+    message = last_reply(update.message.reply_text)
     assert "✅" in message
     assert "Second Product" in message
     assert "/share" not in message
     assert "Stai esaurendo" not in message
 
 
-@pytest.mark.asyncio
-async def test_handle_min_savings_no_share_hint_when_at_max_slots(test_db):
+async def test_handle_min_savings_no_share_hint_when_at_max_slots(seeded_user, tomorrow):
     """Test /add doesn't show /share hint when user is at max (21 slots)."""
-    user_id = 123
-    tomorrow = date.today() + timedelta(days=1)
-
-    # Create user at max slots (21) with 19 existing products
-    await database.add_user(user_id, "it")
+    user_id = seeded_user
+    # Give user max slots (21) and 19 existing products
     await database.set_user_max_products(user_id, 21)
 
     # Add 19 products
-    for i in range(19):
-        await database.add_product(
-            user_id=user_id,
-            product_name=f"Product {i + 1}",
-            asin=f"ASIN000{i + 1:02d}",
-            marketplace="it",
-            price_paid=50.0,
-            return_deadline=tomorrow,
-        )
+    await bulk_add_products(user_id, 19, tomorrow)
 
     # Mock update and context for 20th product (will leave only 1 slot, but at max)
-    update = MagicMock()
-    update.effective_user.id = user_id
-    update.effective_user.language_code = "it"
-    update.message.text = "0"
-    update.message.reply_text = AsyncMock()
-
-    context = MagicMock()
-    context.user_data = {
-        "product_name": "Twentieth Product",
-        "product_asin": "B08N5WRWN0",
-        "product_marketplace": "it",
-        "product_price": 60.00,
-        "product_deadline": tomorrow,
-    }
+    update = make_update("0", user_id=user_id)
+
+    context = SimpleNamespace(
+        user_data={
+            "product_name": "Twentieth Product",
+            "product_asin": "B08N5WRWN0",
+            "product_marketplace": "it",
+            "product_price": 60.00,
+            "product_deadline": tomorrow,
+        }
+    )
 
     # Add 20th product
     result = await handle_min_savings(update, context)
@@ -1339,8 +820,7 @@ async def test_handle_min_savings_no_share_hint_when_at_max_slots(test_db):
     assert update.message.reply_text.call_count == 1
 
     # Verify it's the success message
-    call_args = update.message.reply_text.call_args
-    message = call_args[0][0]
+    message = last_reply(update.message.reply_text)
     assert "✅" in message
     assert "Twentieth Product" in message
     assert "/share" not in message
@@ -1,24 +1,25 @@
 """Tests for handlers/delete.py with button-based selection."""
 
-from datetime import date, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
 
 import database
 from handlers.delete import delete_callback_handler, start_delete
+from tests.helpers import bulk_add_products, make_callback_update, make_update
+
+# Callback data of the fixed /delete buttons; 99999 is an ID no test creates
+CANCEL_MAIN = "delete_cancel_main"
+SELECT_MISSING = "delete_select_99999"
+CONFIRM_MISSING = "delete_confirm_99999"
 
 
 @pytest.mark.asyncio
-async def test_start_delete_no_products(test_db):
+async def test_start_delete_no_products(seeded_user):
     """Test /delete handler with no products."""
-    # Create user with no products
-    await database.add_user(user_id=123, language_code="it")
-
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
+    update = make_update()
+    context = SimpleNamespace(user_data={})
 
     await start_delete(update, context)
 
@@ -31,32 +32,13 @@ async def test_start_delete_no_products(test_db):
 
 
 @pytest.mark.asyncio
-async def test_start_delete_shows_product_list(test_db):
+async def test_start_delete_shows_product_list(seeded_user, tomorrow):
     """Test /delete handler shows product list with buttons."""
-    # Create user and products
-    await database.add_user(user_id=123, language_code="it")
-    tomorrow = date.today() + timedelta(days=1)
-    await database.add_product(
-        user_id=123,
-        product_name="Test Product 1",
-        asin="ASIN00001",
-        marketplace="it",
-        price_paid=50.0,
-        return_deadline=tomorrow,
-    )
-    await database.add_product(
-        user_id=123,
-        product_name="Test Product 2",
-        asin="ASIN00002",
-        marketplace="it",
-        price_paid=75.0,
-        return_deadline=tomorrow,
-    )
+    # Create products
+    await bulk_add_products(123, 2, tomorrow)
 
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
+    update = make_update()
+    context = SimpleNamespace(user_data={})
 
     await start_delete(update, context)
 
@@ -80,11 +62,9 @@ async def test_start_delete_shows_product_list(test_db):
 
 
 @pytest.mark.asyncio
-async def test_delete_callback_select_product(test_db):
+async def test_delete_callback_select_product(seeded_user, tomorrow):
     """Test selecting a product shows confirmation dialog."""
-    # Create user and product
-    await database.add_user(user_id=123, language_code="it")
-    tomorrow = date.today() + timedelta(days=1)
+    # Create product
     await database.add_product(
         user_id=123,
         product_name="Test Product",
@@ -99,14 +79,9 @@ async def test_delete_callback_select_product(test_db):
     product_id = products[0]["id"]
 
     # Mock callback query
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.callback_query = MagicMock()
-    update.callback_query.answer = AsyncMock()
-    update.callback_query.edit_message_text = AsyncMock()
-    update.callback_query.data = f"delete_select_{product_id}"
+    update = make_callback_update(f"delete_select_{product_id}")
 
-    context = MagicMock()
+    context = SimpleNamespace(user_data={})
 
     await delete_callback_handler(update, context)
 
@@ -136,42 +111,21 @@ async def test_delete_callback_select_product(test_db):
 
 
 @pytest.mark.asyncio
-async def test_delete_callback_confirm(test_db):
+async def test_delete_callback_confirm(seeded_user, tomorrow):
     """Test delete confirmation callback deletes the product."""
-    # Create user and products
-    await database.add_user(user_id=123, language_code="it")
-    tomorrow = date.today() + timedelta(days=1)
-    await database.add_product(
-        user_id=123,
-        product_name="Product 1",
-        asin="ASIN00001",
-        marketplace="it",
-        price_paid=50.0,
-        return_deadline=tomorrow,
-    )
-    await database.add_product(
-        user_id=123,
-        product_name="Product 2",
-        asin="ASIN00002",
-        marketplace="it",
-        price_paid=75.0,
-        return_deadline=tomorrow,
-    )
+    # Create products
+    await bulk_add_products(123, 2, tomorrow)
 
     # Verify 2 products exist
     products_before = await database.get_user_products(123)
     assert len(products_before) == 2
-    product_id = products_before[1]["id"]  # Second product
+    # Pick by ASIN: both rows can share the same added_at second
+    product_id = next(p["id"] for p in products_before if p["asin"] == "B0TEST0002")
 
     # Mock callback query
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.callback_query = MagicMock()
-    update.callback_query.answer = AsyncMock()
-    update.callback_query.edit_message_text = AsyncMock()
-    update.callback_query.data = f"delete_confirm_{product_id}"
+    update = make_callback_update(f"delete_confirm_{product_id}")
 
-    context = MagicMock()
+    context = SimpleNamespace(user_data={})
 
     await delete_callback_handler(update, context)
 
@@ -188,15 +142,13 @@ async def test_delete_callback_confirm(test_db):
     # Verify product was actually deleted
     products_after = await database.get_user_products(123)
     assert len(products_after) == 1
-    assert products_after[0]["asin"] == "ASIN00001"
+    assert products_after[0]["asin"] == "B0TEST0001"
 
 
 @pytest.mark.asyncio
-async def test_delete_callback_cancel(test_db):
+async def test_delete_callback_cancel(seeded_user, tomorrow):
     """Test delete cancellation callback does not delete the product."""
-    # Create user and product
-    await database.add_user(user_id=123, language_code="it")
-    tomorrow = date.today() + timedelta(days=1)
+    # Create product
     await database.add_product(
         user_id=123,
         product_name="Test Product",
@@ -211,14 +163,9 @@ async def test_delete_callback_cancel(test_db):
     product_id = products_before[0]["id"]
 
     # Mock callback query
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.callback_query = MagicMock()
-    update.callback_query.answer = AsyncMock()
-    update.callback_query.edit_message_text = AsyncMock()
-    update.callback_query.data = f"delete_cancel_{product_id}"
+    update = make_callback_update(f"delete_cancel_{product_id}")
 
-    context = MagicMock()
+    context = SimpleNamespace(user_data={})
 
     await delete_callback_handler(update, context)
 
@@ -238,16 +185,11 @@ async def test_delete_callback_cancel(test_db):
 
 
 @pytest.mark.asyncio
-async def test_delete_callback_cancel_main(test_db):
+async def test_delete_callback_cancel_main():
     """Test cancel from main product list."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.callback_query = MagicMock()
-    update.callback_query.answer = AsyncMock()
-    update.callback_query.edit_message_text = AsyncMock()
-    update.callback_query.data = "delete_cancel_main"
+    update = make_callback_update(CANCEL_MAIN)
 
-    context = MagicMock()
+    context = SimpleNamespace(user_data={})
 
     await delete_callback_handler(update, context)
 
@@ -261,20 +203,12 @@ async def test_delete_callback_cancel_main(test_db):
 
 
 @pytest.mark.asyncio
-async def test_delete_callback_product_not_found_on_select(test_db):
+async def test_delete_callback_product_not_found_on_select(seeded_user):
     """Test product selection with non-existent product."""
-    # Create user with no products
-    await database.add_user(user_id=123, language_code="it")
-
     # Mock callback query with non-existent product_id
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.callback_query = MagicMock()
-    update.callback_query.answer = AsyncMock()
-    update.callback_query.edit_message_text = AsyncMock()
-    update.callback_query.data = "delete_select_99999"  # Non-existent ID
+    update = make_callback_update(SELECT_MISSING)
 
-    context = MagicMock()
+    context = SimpleNamespace(user_data={})
 
     await delete_callback_handler(update, context)
 
@@ -285,20 +219,12 @@ async def test_delete_callback_product_not_found_on_select(test_db):
 
 
 @pytest.mark.asyncio
-async def test_delete_callback_product_not_found_on_confirm(test_db):
+async def test_delete_callback_product_not_found_on_confirm(seeded_user):
     """Test delete confirmation with non-existent product."""
-    # Create user with no products
-    await database.add_user(user_id=123, language_code="it")
-
     # Mock callback query with non-existent product_id
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.callback_query = MagicMock()
-    update.callback_query.answer = AsyncMock()
-    update.callback_query.edit_message_text = AsyncMock()
-    update.callback_query.data = "delete_confirm_99999"  # Non-existent ID
+    update = make_callback_update(CONFIRM_MISSING)
 
-    context = MagicMock()
+    context = SimpleNamespace(user_data={})
 
     await delete_callback_handler(update, context)
 
@@ -309,52 +235,45 @@ async def test_delete_callback_product_not_found_on_confirm(test_db):
 
 
 @pytest.mark.asyncio
-async def test_start_delete_database_error(test_db):
+async def test_start_delete_database_error(monkeypatch):
     """Test /delete handler handles database errors gracefully."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
+    update = make_update()
+    context = SimpleNamespace(user_data={})
 
-    # Mock database.get_user_products to raise an exception
-    with patch("handlers.delete.database.get_user_products", side_effect=Exception("DB Error")):
-        await start_delete(update, context)
+    # Make database.get_user_products raise an exception
+    monkeypatch.setattr(database, "get_user_products", AsyncMock(side_effect=Exception("DB Error")))
 
-        # Verify error message was sent
-        call_args = update.message.reply_text.call_args
-        message = call_args[0][0]
-        assert "Errore" in message
+    await start_delete(update, context)
+
+    # Verify error message was sent
+    call_args = update.message.reply_text.call_args
+    message = call_args[0][0]
+    assert "Errore" in message
 
 
 @pytest.mark.asyncio
-async def test_delete_callback_database_error(test_db):
+async def test_delete_callback_database_error(monkeypatch):
     """Test delete callback handles database errors gracefully."""
     # Mock callback query
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.callback_query = MagicMock()
-    update.callback_query.answer = AsyncMock()
-    update.callback_query.edit_message_text = AsyncMock()
-    update.callback_query.data = "delete_confirm_1"
+    update = make_callback_update("delete_confirm_1")
 
-    context = MagicMock()
+    context = SimpleNamespace(user_data={})
 
-    # Mock database.get_user_products to raise an exception
-    with patch("handlers.delete.database.get_user_products", side_effect=Exception("DB Error")):
-        await delete_callback_handler(update, context)
+    # Make database.get_user_products raise an exception
+    monkeypatch.setattr(database, "get_user_products", AsyncMock(side_effect=Exception("DB Error")))
 
-        # Verify error message was shown
-        call_args = update.callback_query.edit_message_text.call_args
-        message = call_args[0][0]
-        assert "Errore" in message
+    await delete_callback_handler(update, context)
+
+    # Verify error message was shown
+    call_args = update.callback_query.edit_message_text.call_args
+    message = call_args[0][0]
+    assert "Errore" in message
 
 
 @pytest.mark.asyncio
-async def test_delete_product_without_name(test_db):
+async def test_delete_product_without_name(seeded_user, tomorrow):
     """Test deleting product without name (legacy product)."""
-    # Create user and product without name
-    await database.add_user(user_id=123, language_code="it")
-    tomorrow = date.today() + timedelta(days=1)
+    # Create product without name
     await database.add_product(
         user_id=123,
         product_name=None,  # No name
@@ -368,14 +287,9 @@ async def test_delete_product_without_name(test_db):
     product_id = products[0]["id"]
 
     # Mock callback query for selection
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.callback_query = MagicMock()
-    update.callback_query.answer = AsyncMock()
-    update.callback_query.edit_message_text = AsyncMock()
-    update.callback_query.data = f"delete_select_{product_id}"
-
-    context = MagicMock()
+    update = make_callback_update(f"delete_select_{product_id}")
+
+    context = SimpleNamespace(user_data={})
 
     await delete_callback_handler(update, context)
 
@@ -1,7 +1,8 @@
 """Tests for handlers/feedback.py."""
 
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 from telegram.ext import ConversationHandler
@@ -16,15 +17,14 @@ from handlers.feedback import (
     handle_feedback_message,
     start_feedback,
 )
+from tests.helpers import make_callback_update, make_update
 
 
 @pytest.mark.asyncio
 async def test_start_feedback(test_db):
     """Test start_feedback shows initial message."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
+    update = make_update()
+    context = SimpleNamespace()
 
     # Add user to database
     await database.add_user(123)
@@ -46,11 +46,8 @@ async def test_start_feedback(test_db):
 @pytest.mark.asyncio
 async def test_handle_feedback_message_too_short():
     """Test handle_feedback_message rejects too short feedback."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.text = "Short"  # 5 characters < MIN_FEEDBACK_LENGTH (10)
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
+    update = make_update("Short")  # 5 characters < MIN_FEEDBACK_LENGTH (10)
+    context = SimpleNamespace()
 
     result = await handle_feedback_message(update, context)
 
@@ -67,11 +64,8 @@ async def test_handle_feedback_message_too_short():
 @pytest.mark.asyncio
 async def test_handle_feedback_message_too_long():
     """Test handle_feedback_message rejects too long feedback."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.text = "A" * (MAX_FEEDBACK_LENGTH + 1)  # 1001 characters
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
+    update = make_update("A" * (MAX_FEEDBACK_LENGTH + 1))  # 1001 characters
+    context = SimpleNamespace()
 
     result = await handle_feedback_message(update, context)
 
@@ -88,12 +82,8 @@ async def test_handle_feedback_message_too_long():
 @pytest.mark.asyncio
 async def test_handle_feedback_message_valid():
     """Test handle_feedback_message shows preview for valid feedback."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.text = "Questo è un feedback valido con più di 10 caratteri"
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.user_data = {}
+    update = make_update("Questo è un feedback valido con più di 10 caratteri")
+    context = SimpleNamespace(user_data={})
 
     result = await handle_feedback_message(update, context)
 
@@ -119,13 +109,9 @@ async def test_handle_feedback_message_valid():
 @pytest.mark.asyncio
 async def test_handle_feedback_message_long_preview_truncation():
     """Test handle_feedback_message truncates long preview."""
-    update = MagicMock()
-    update.effective_user.id = 123
     # Create feedback > 200 chars for preview truncation
-    update.message.text = "A" * 250
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.user_data = {}
+    update = make_update("A" * 250)
+    context = SimpleNamespace(user_data={})
 
     await handle_feedback_message(update, context)
 
@@ -139,21 +125,12 @@ async def test_handle_feedback_message_long_preview_truncation():
 
 
 @pytest.mark.asyncio
-async def test_handle_feedback_confirmation_send_success(test_db):
+async def test_handle_feedback_confirmation_send_success(seeded_user):
     """Test handle_feedback_confirmation sends feedback successfully."""
-    # Create user first (required for foreign key constraint)
-    await database.add_user(user_id=123, language_code="it")
+    update = make_callback_update("feedback_send")
 
-    update = MagicMock()
-    update.callback_query = MagicMock()
-    update.callback_query.answer = AsyncMock()
-    update.callback_query.edit_message_text = AsyncMock()
-    update.callback_query.data = "feedback_send"
-    update.effective_user.id = 123
-
-    context = MagicMock()
     feedback_msg = "Questo è un feedback di test molto utile"
-    context.user_data = {"feedback_message": feedback_msg}
+    context = SimpleNamespace(user_data={"feedback_message": feedback_msg})
 
     await handle_feedback_confirmation(update, context)
 
@@ -176,15 +153,9 @@ async def test_handle_feedback_confirmation_send_success(test_db):
 @pytest.mark.asyncio
 async def test_handle_feedback_confirmation_cancel():
     """Test handle_feedback_confirmation cancels feedback."""
-    update = MagicMock()
-    update.callback_query = MagicMock()
-    update.callback_query.answer = AsyncMock()
-    update.callback_query.edit_message_text = AsyncMock()
-    update.callback_query.data = "feedback_cancel"
-    update.effective_user.id = 123
+    update = make_callback_update("feedback_cancel")
 
-    context = MagicMock()
-    context.user_data = {"feedback_message": "Test feedback"}
+    context = SimpleNamespace(user_data={"feedback_message": "Test feedback"})
 
     await handle_feedback_confirmation(update, context)
 
@@ -200,15 +171,9 @@ async def test_handle_feedback_confirmation_cancel():
 @pytest.mark.asyncio
 async def test_handle_feedback_confirmation_missing_message():
     """Test handle_feedback_confirmation handles missing feedback_message."""
-    update = MagicMock()
-    update.callback_query = MagicMock()
-    update.callback_query.answer = AsyncMock()
-    update.callback_query.edit_message_text = AsyncMock()
-    update.callback_query.data = "feedback_send"
-    update.effective_user.id = 123
+    update = make_callback_update("feedback_send")
 
-    context = MagicMock()
-    context.user_data = {}  # No feedback_message
+    context = SimpleNamespace(user_data={})  # No feedback_message
 
     await handle_feedback_confirmation(update, context)
 
@@ -222,15 +187,9 @@ async def test_handle_feedback_confirmation_missing_message():
 @pytest.mark.asyncio
 async def test_handle_feedback_confirmation_database_error(test_db):
     """Test handle_feedback_confirmation handles database errors."""
-    update = MagicMock()
-    update.callback_query = MagicMock()
-    update.callback_query.answer = AsyncMock()
-    update.callback_query.edit_message_text = AsyncMock()
-    update.callback_query.data = "feedback_send"
-    update.effective_user.id = 123
+    update = make_callback_update("feedback_send")
 
-    context = MagicMock()
-    context.user_data = {"feedback_message": "Test feedback"}
+    context = SimpleNamespace(user_data={"feedback_message": "Test feedback"})
 
     # Mock database error
     with patch("handlers.feedback.database.add_feedback", side_effect=Exception("DB Error")):
@@ -245,12 +204,8 @@ async def test_handle_feedback_confirmation_database_error(test_db):
 @pytest.mark.asyncio
 async def test_handle_feedback_message_with_special_characters():
     """Test handle_feedback_message accepts special characters."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.text = "Bot eccezionale! 💯👍 Funziona benissimo 🚀"
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.user_data = {}
+    update = make_update("Bot eccezionale! 💯👍 Funziona benissimo 🚀")
+    context = SimpleNamespace(user_data={})
 
     result = await handle_feedback_message(update, context)
 
@@ -270,10 +225,8 @@ async def test_handle_feedback_message_with_special_characters():
 @pytest.mark.asyncio
 async def test_cancel():
     """Test cancel command."""
-    update = MagicMock()
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.user_data = {"feedback_message": "Test"}
+    update = make_update()
+    context = SimpleNamespace(user_data={"feedback_message": "Test"})
 
     result = await cancel(update, context)
 
@@ -292,12 +245,8 @@ async def test_cancel():
 @pytest.mark.asyncio
 async def test_handle_feedback_message_strips_whitespace():
     """Test handle_feedback_message strips leading/trailing whitespace."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.text = "   Feedback con spazi   "
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.user_data = {}
+    update = make_update("   Feedback con spazi   ")
+    context = SimpleNamespace(user_data={})
 
     await handle_feedback_message(update, context)
 
@@ -308,10 +257,8 @@ async def test_handle_feedback_message_strips_whitespace():
 @pytest.mark.asyncio
 async def test_start_feedback_first_time_no_rate_limit(test_db):
     """Test start_feedback allows first feedback (no rate limiting)."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
+    update = make_update()
+    context = SimpleNamespace()
 
     # Add user to database
     await database.add_user(123)
@@ -332,10 +279,8 @@ async def test_start_feedback_first_time_no_rate_limit(test_db):
 @pytest.mark.asyncio
 async def test_start_feedback_rate_limited_within_24_hours(test_db):
     """Test start_feedback blocks second feedback within 24 hours."""
-    update = MagicMock()
-    update.effective_user.id = 456
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
+    update = make_update(user_id=456)
+    context = SimpleNamespace()
 
     # Add user and first feedback
     await database.add_user(456)
@@ -357,10 +302,8 @@ async def test_start_feedback_rate_limited_within_24_hours(test_db):
 @pytest.mark.asyncio
 async def test_start_feedback_rate_limit_expired_after_24_hours(test_db):
     """Test start_feedback allows feedback after 24 hours."""
-    update = MagicMock()
-    update.effective_user.id = 789
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
+    update = make_update(user_id=789)
+    context = SimpleNamespace()
 
     # Add user
     await database.add_user(789)
@@ -386,10 +329,8 @@ async def test_start_feedback_rate_limit_expired_after_24_hours(test_db):
 @pytest.mark.asyncio
 async def test_start_feedback_rate_limit_shows_hours_remaining(test_db):
     """Test start_feedback shows hours when >1 hour remaining."""
-    update = MagicMock()
-    update.effective_user.id = 111
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
+    update = make_update(user_id=111)
+    context = SimpleNamespace()
 
     # Add user
     await database.add_user(111)
@@ -413,10 +354,8 @@ async def test_start_feedback_rate_limit_shows_hours_remaining(test_db):
 @pytest.mark.asyncio
 async def test_start_feedback_rate_limit_shows_minutes_remaining(test_db):
     """Test start_feedback shows minutes when <1 hour remaining."""
-    update = MagicMock()
-    update.effective_user.id = 222
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
+    update = make_update(user_id=222)
+    context = SimpleNamespace()
 
     # Add user
     await database.add_user(222)
@@ -440,10 +379,8 @@ async def test_start_feedback_rate_limit_shows_minutes_remaining(test_db):
 @pytest.mark.asyncio
 async def test_start_feedback_rate_limit_invalid_timestamp_allows_feedback(test_db):
     """Test start_feedback allows feedback if timestamp parsing fails (fail open)."""
-    update = MagicMock()
-    update.effective_user.id = 333
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
+    update = make_update(user_id=333)
+    context = SimpleNamespace()
 
     # Add user
     await database.add_user(333)
@@ -1,19 +1,18 @@
 """Tests for handlers/help.py."""
 
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
 
 import pytest
 
 from handlers.help import help_handler
+from tests.helpers import make_update
 
 
 @pytest.mark.asyncio
 async def test_help_handler():
     """Test /help handler returns help message."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
+    update = make_update()
+    context = SimpleNamespace(user_data={})
 
     await help_handler(update, context)
 
@@ -49,10 +48,8 @@ async def test_help_handler():
 async def test_help_handler_multiple_users():
     """Test /help handler works for different users."""
     for user_id in [123, 456, 789]:
-        update = MagicMock()
-        update.effective_user.id = user_id
-        update.message.reply_text = AsyncMock()
-        context = MagicMock()
+        update = make_update(user_id=user_id)
+        context = SimpleNamespace()
 
         await help_handler(update, context)
 
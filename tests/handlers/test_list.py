@@ -1,25 +1,22 @@
 """Tests for handlers/list.py."""
 
-from datetime import date, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
 import database
 from handlers.list import list_handler
+from tests.helpers import bulk_add_products, make_update
 
 
 @pytest.mark.asyncio
-async def test_list_handler_no_products(test_db):
+async def test_list_handler_no_products(seeded_user):
     """Test /list handler with no products."""
-    # Create user with no products
-    await database.add_user(user_id=123, language_code="it")
-
     # Create mock update and context
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
+    update = make_update()
+    context = SimpleNamespace()
 
     # Call handler
     await list_handler(update, context)
@@ -34,27 +31,22 @@ async def test_list_handler_no_products(test_db):
 
 
 @pytest.mark.asyncio
-async def test_list_handler_single_product(test_db):
+async def test_list_handler_single_product(seeded_user, today):
     """Test /list handler with single product."""
-    # Create user and product
-    await database.add_user(user_id=123, language_code="it")
-
-    tomorrow = date.today() + timedelta(days=5)
+    deadline = today + timedelta(days=5)
     await database.add_product(
         user_id=123,
         product_name="Test Product",
         asin="B08N5WRWNW",
         marketplace="it",
         price_paid=59.90,
-        return_deadline=tomorrow,
+        return_deadline=deadline,
         min_savings_threshold=5.0,
     )
 
     # Create mock update and context
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
+    update = make_update()
+    context = SimpleNamespace()
 
     # Call handler
     await list_handler(update, context)
@@ -73,13 +65,9 @@ async def test_list_handler_single_product(test_db):
 
 
 @pytest.mark.asyncio
-async def test_list_handler_multiple_products(test_db):
+async def test_list_handler_multiple_products(seeded_user, tomorrow, today):
     """Test /list handler with multiple products."""
-    # Create user and products
-    await database.add_user(user_id=123, language_code="it")
-
-    tomorrow = date.today() + timedelta(days=1)
-    next_week = date.today() + timedelta(days=7)
+    next_week = today + timedelta(days=7)
 
     await database.add_product(
         user_id=123,
@@ -100,10 +88,8 @@ async def test_list_handler_multiple_products(test_db):
     )
 
     # Create mock update and context
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
+    update = make_update()
+    context = SimpleNamespace()
 
     # Call handler
     await list_handler(update, context)
@@ -122,11 +108,8 @@ async def test_list_handler_multiple_products(test_db):
 
 
 @pytest.mark.asyncio
-async def test_list_handler_deadline_today(test_db):
+async def test_list_handler_deadline_today(seeded_user, today):
     """Test /list handler with deadline today."""
-    await database.add_user(user_id=123, language_code="it")
-
-    today = date.today()
     await database.add_product(
         user_id=123,
         product_name="Test Product",
@@ -136,10 +119,8 @@ async def test_list_handler_deadline_today(test_db):
         return_deadline=today,
     )
 
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
+    update = make_update()
+    context = SimpleNamespace()
 
     await list_handler(update, context)
 
@@ -149,11 +130,9 @@ async def test_list_handler_deadline_today(test_db):
 
 
 @pytest.mark.asyncio
-async def test_list_handler_deadline_expired(test_db):
+async def test_list_handler_deadline_expired(seeded_user, today):
     """Test /list handler with expired deadline."""
-    await database.add_user(user_id=123, language_code="it")
-
-    yesterday = date.today() - timedelta(days=1)
+    yesterday = today - timedelta(days=1)
     await database.add_product(
         user_id=123,
         product_name="Test Product",
@@ -163,10 +142,8 @@ async def test_list_handler_deadline_expired(test_db):
         return_deadline=yesterday,
     )
 
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
+    update = make_update()
+    context = SimpleNamespace()
 
     await list_handler(update, context)
 
@@ -176,11 +153,8 @@ async def test_list_handler_deadline_expired(test_db):
 
 
 @pytest.mark.asyncio
-async def test_list_handler_no_threshold(test_db):
+async def test_list_handler_no_threshold(seeded_user, tomorrow):
     """Test /list handler with product without threshold."""
-    await database.add_user(user_id=123, language_code="it")
-
-    tomorrow = date.today() + timedelta(days=1)
     await database.add_product(
         user_id=123,
         product_name="Test Product",
@@ -191,10 +165,8 @@ async def test_list_handler_no_threshold(test_db):
         min_savings_threshold=None,
     )
 
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
+    update = make_update()
+    context = SimpleNamespace()
 
     await list_handler(update, context)
 
@@ -207,10 +179,8 @@ async def test_list_handler_no_threshold(test_db):
 @pytest.mark.asyncio
 async def test_list_handler_database_error(test_db):
     """Test /list handler handles database errors gracefully."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
+    update = make_update()
+    context = SimpleNamespace()
 
     # Mock database.get_user_products to raise an exception
     with patch("handlers.list.database.get_user_products", side_effect=Exception("DB Error")):
@@ -224,28 +194,16 @@ async def test_list_handler_database_error(test_db):
 
 
 @pytest.mark.asyncio
-async def test_list_handler_shows_share_hint_when_low_on_slots(test_db):
+async def test_list_handler_shows_share_hint_when_low_on_slots(seeded_user, tomorrow):
     """Test /list shows /share hint when user has <3 slots available and <21 total."""
-    # Create user with 6 slots
-    await database.add_user(user_id=123, language_code="it")
+    # Give the user 6 slots
     await database.set_user_max_products(user_id=123, limit=6)
 
     # Add 5 products (only 1 slot remaining)
-    tomorrow = date.today() + timedelta(days=1)
-    for i in range(5):
-        await database.add_product(
-            user_id=123,
-            product_name=f"Product {i + 1}",
-            asin=f"ASIN0000{i + 1}",
-            marketplace="it",
-            price_paid=50.0,
-            return_deadline=tomorrow,
-        )
-
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
+    await bulk_add_products(123, 5, tomorrow)
+
+    update = make_update()
+    context = SimpleNamespace()
 
     await list_handler(update, context)
 
@@ -258,28 +216,16 @@ async def test_list_handler_shows_share_hint_when_low_on_slots(test_db):
 
 
 @pytest.mark.asyncio
-async def test_list_handler_no_share_hint_when_enough_slots(test_db):
+async def test_list_handler_no_share_hint_when_enough_slots(seeded_user, tomorrow):
     """Test /list doesn't show /share hint when user has ≥3 slots available."""
-    # Create user with 6 slots
-    await database.add_user(user_id=123, language_code="it")
+    # Give the user 6 slots
     await database.set_user_max_products(user_id=123, limit=6)
 
     # Add 2 products (4 slots remaining)
-    tomorrow = date.today() + timedelta(days=1)
-    for i in range(2):
-        await database.add_product(
-            user_id=123,
-            product_name=f"Product {i + 1}",
-            asin=f"ASIN0000{i + 1}",
-            marketplace="it",
-            price_paid=50.0,
-            return_deadline=tomorrow,
-        )
-
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
+    await bulk_add_products(123, 2, tomorrow)
+
+    update = make_update()
+    context = SimpleNamespace()
 
     await list_handler(update, context)
 
@@ -292,28 +238,16 @@ async def test_list_handler_no_share_hint_when_enough_slots(test_db):
 
 
 @pytest.mark.asyncio
-async def test_list_handler_no_share_hint_when_at_max_slots(test_db):
+async def test_list_handler_no_share_hint_when_at_max_slots(seeded_user, tomorrow):
     """Test /list doesn't show /share hint when user is already at max (21 slots)."""
-    # Create user at max slots (21)
-    await database.add_user(user_id=123, language_code="it")
+    # Put the user at max slots (21)
     await database.set_user_max_products(user_id=123, limit=21)
 
     # Add 20 products (only 1 slot remaining, but at max)
-    tomorrow = date.today() + timedelta(days=1)
-    for i in range(20):
-        await database.add_product(
-            user_id=123,
-            product_name=f"Product {i + 1}",
-            asin=f"ASIN000{i + 1:02d}",
-            marketplace="it",
-            price_paid=50.0,
-            return_deadline=tomorrow,
-        )
-
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
+    await bulk_add_products(123, 20, tomorrow)
+
+    update = make_update()
+    context = SimpleNamespace()
 
     await list_handler(update, context)
 
@@ -326,12 +260,9 @@ async def test_list_handler_no_share_hint_when_at_max_slots(test_db):
 
 
 @pytest.mark.asyncio
-async def test_list_handler_escapes_html_characters(test_db):
+async def test_list_handler_escapes_html_characters(seeded_user, tomorrow):
     """Test that product names with HTML characters are properly escaped."""
-    await database.add_user(user_id=123, language_code="it")
-
     # Add product with HTML special characters in name
-    tomorrow = date.today() + timedelta(days=1)
     await database.add_product(
         user_id=123,
         product_name="Test <script>alert('xss')</script> & Co.",
@@ -341,10 +272,8 @@ async def test_list_handler_escapes_html_characters(test_db):
         return_deadline=tomorrow,
     )
 
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
+    update = make_update()
+    context = SimpleNamespace()
 
     await list_handler(update, context)
 
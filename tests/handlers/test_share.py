@@ -1,21 +1,20 @@
 """Tests for handlers/share.py."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from handlers.share import share_handler
+from tests.helpers import make_update
 
 
 @pytest.mark.asyncio
 async def test_share_handler_success():
     """Test /share handler shows referral link and slot count."""
-    update = MagicMock()
-    update.effective_user.id = 123456
-    update.message.reply_text = AsyncMock()
+    update = make_update(user_id=123456)
 
-    context = MagicMock()
-    context.bot.username = "repackit_bot"
+    context = SimpleNamespace(bot=SimpleNamespace(username="repackit_bot"))
 
     with patch("handlers.share.database") as mock_db:
         mock_db.get_user_product_limit = AsyncMock(return_value=9)
@@ -49,46 +48,41 @@ async def test_share_handler_success():
 
 
 @pytest.mark.asyncio
-async def test_share_handler_different_slot_counts():
-    """Test /share handler with different slot counts."""
-    test_cases = [
+@pytest.mark.parametrize(
+    "current_slots, max_slots",
+    [
         (3, 21),  # New user
         (6, 21),  # Invited user
         (12, 21),  # User with some referrals
         (21, 21),  # User at max
-    ]
-
-    for current_slots, max_slots in test_cases:
-        update = MagicMock()
-        update.effective_user.id = 123
-        update.message.reply_text = AsyncMock()
+    ],
+)
+async def test_share_handler_different_slot_counts(current_slots, max_slots):
+    """Test /share handler with different slot counts."""
+    update = make_update()
 
-        context = MagicMock()
-        context.bot.username = "test_bot"
+    context = SimpleNamespace(bot=SimpleNamespace(username="test_bot"))
 
-        with patch("handlers.share.database") as mock_db:
-            mock_db.get_user_product_limit = AsyncMock(return_value=current_slots)
-            mock_db.DEFAULT_MAX_PRODUCTS = max_slots
+    with patch("handlers.share.database") as mock_db:
+        mock_db.get_user_product_limit = AsyncMock(return_value=current_slots)
+        mock_db.DEFAULT_MAX_PRODUCTS = max_slots
 
-            await share_handler(update, context)
+        await share_handler(update, context)
 
-            # Verify message contains correct slot count
-            update.message.reply_text.assert_called_once()
-            call_args = update.message.reply_text.call_args
-            message = call_args[0][0]
+        # Verify message contains correct slot count
+        update.message.reply_text.assert_called_once()
+        call_args = update.message.reply_text.call_args
+        message = call_args[0][0]
 
-            assert f"{current_slots}/{max_slots}" in message
+        assert f"{current_slots}/{max_slots}" in message
 
 
 @pytest.mark.asyncio
 async def test_share_handler_database_error():
     """Test /share handler handles database errors gracefully."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.reply_text = AsyncMock()
+    update = make_update()
 
-    context = MagicMock()
-    context.bot.username = "test_bot"
+    context = SimpleNamespace(bot=SimpleNamespace(username="test_bot"))
 
     with patch("handlers.share.database") as mock_db:
         # Simulate database error
@@ -111,12 +105,9 @@ async def test_share_handler_referral_link_format():
     user_ids = [123, 456789, 999999999]
 
     for user_id in user_ids:
-        update = MagicMock()
-        update.effective_user.id = user_id
-        update.message.reply_text = AsyncMock()
+        update = make_update(user_id=user_id)
 
-        context = MagicMock()
-        context.bot.username = "my_bot"
+        context = SimpleNamespace(bot=SimpleNamespace(username="my_bot"))
 
         with patch("handlers.share.database") as mock_db:
             mock_db.get_user_product_limit = AsyncMock(return_value=6)
@@ -135,12 +126,9 @@ async def test_share_handler_referral_link_format():
 @pytest.mark.asyncio
 async def test_share_handler_share_button_url():
     """Test /share handler share button URL is properly formatted."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.reply_text = AsyncMock()
+    update = make_update()
 
-    context = MagicMock()
-    context.bot.username = "test_bot"
+    context = SimpleNamespace(bot=SimpleNamespace(username="test_bot"))
 
     with patch("handlers.share.database") as mock_db:
         mock_db.get_user_product_limit = AsyncMock(return_value=6)
@@ -1,22 +1,21 @@
 """Tests for handlers/start.py."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
 import database
 from handlers.start import start_handler
+from tests.helpers import make_update
 
 
 @pytest.mark.asyncio
 async def test_start_handler_new_user(test_db):
     """Test /start handler with new user."""
     # Create mock update and context
-    update = MagicMock()
-    update.effective_user.id = 12345
-    update.effective_user.language_code = "it"
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
+    update = make_update(user_id=12345)
+    context = SimpleNamespace(args=[])
 
     # Call handler
     await start_handler(update, context)
@@ -45,11 +44,8 @@ async def test_start_handler_existing_user(test_db):
     await database.add_user(user_id=12345, language_code="en")
 
     # Create mock update and context
-    update = MagicMock()
-    update.effective_user.id = 12345
-    update.effective_user.language_code = "en"
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
+    update = make_update(user_id=12345, language_code="en")
+    context = SimpleNamespace(args=[])
 
     # Call handler (should not fail with existing user)
     await start_handler(update, context)
@@ -61,11 +57,8 @@ async def test_start_handler_existing_user(test_db):
 @pytest.mark.asyncio
 async def test_start_handler_database_error(test_db):
     """Test /start handler handles database errors gracefully."""
-    update = MagicMock()
-    update.effective_user.id = 12345
-    update.effective_user.language_code = "it"
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
+    update = make_update(user_id=12345)
+    context = SimpleNamespace(args=[])
 
     # Mock database.add_user to raise an exception
     with patch("handlers.start.database.add_user", side_effect=Exception("DB Error")):
@@ -79,11 +72,8 @@ async def test_start_handler_database_error(test_db):
 @pytest.mark.asyncio
 async def test_start_handler_no_language_code(test_db):
     """Test /start handler when user has no language code."""
-    update = MagicMock()
-    update.effective_user.id = 12345
-    update.effective_user.language_code = None
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
+    update = make_update(user_id=12345, language_code=None)
+    context = SimpleNamespace(args=[])
 
     await start_handler(update, context)
 
@@ -103,12 +93,8 @@ async def test_start_handler_with_valid_referral(test_db):
     await database.add_user(user_id=99999, language_code="it")
 
     # Create mock update and context with referral code
-    update = MagicMock()
-    update.effective_user.id = 12345
-    update.effective_user.language_code = "it"
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.args = ["99999"]  # Referral code
+    update = make_update(user_id=12345)
+    context = SimpleNamespace(args=["99999"])  # Referral code
 
     # Call handler
     await start_handler(update, context)
@@ -135,12 +121,8 @@ async def test_start_handler_with_valid_referral(test_db):
 async def test_start_handler_with_invalid_referral_code(test_db):
     """Test /start handler with non-existent referrer."""
     # Create mock update and context with invalid referral code
-    update = MagicMock()
-    update.effective_user.id = 12345
-    update.effective_user.language_code = "it"
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.args = ["99999"]  # Non-existent referrer
+    update = make_update(user_id=12345)
+    context = SimpleNamespace(args=["99999"])  # Non-existent referrer
 
     # Call handler
     await start_handler(update, context)
@@ -164,12 +146,8 @@ async def test_start_handler_with_invalid_referral_code(test_db):
 async def test_start_handler_with_self_referral(test_db):
     """Test /start handler with self-referral attempt."""
     # Create mock update and context with self-referral
-    update = MagicMock()
-    update.effective_user.id = 12345
-    update.effective_user.language_code = "it"
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.args = ["12345"]  # Same as user_id (self-referral)
+    update = make_update(user_id=12345)
+    context = SimpleNamespace(args=["12345"])  # Same as user_id (self-referral)
 
     # Call handler
     await start_handler(update, context)
@@ -193,12 +171,8 @@ async def test_start_handler_with_self_referral(test_db):
 async def test_start_handler_with_malformed_referral_code(test_db):
     """Test /start handler with malformed referral code."""
     # Create mock update and context with non-numeric referral code
-    update = MagicMock()
-    update.effective_user.id = 12345
-    update.effective_user.language_code = "it"
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.args = ["abc123"]  # Invalid format
+    update = make_update(user_id=12345)
+    context = SimpleNamespace(args=["abc123"])  # Invalid format
 
     # Call handler
     await start_handler(update, context)
@@ -227,12 +201,8 @@ async def test_start_handler_existing_user_ignores_referral(test_db):
     await database.add_user(user_id=99999, language_code="it")
 
     # Try to use referral code as existing user
-    update = MagicMock()
-    update.effective_user.id = 12345
-    update.effective_user.language_code = "it"
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.args = ["99999"]
+    update = make_update(user_id=12345)
+    context = SimpleNamespace(args=["99999"])
 
     await start_handler(update, context)
 
@@ -1,7 +1,8 @@
 """Tests for handlers/update.py with conversational flow."""
 
-from datetime import date, timedelta
-from unittest.mock import AsyncMock, MagicMock
+import re
+from datetime import timedelta
+from types import SimpleNamespace
 
 import pytest
 from telegram.ext import ConversationHandler
@@ -17,6 +18,14 @@ from handlers.update import (
     handle_value_input,
     start_update,
 )
+from tests.helpers import make_callback_update, make_update
+
+# Accepted wordings of the replies, compiled once and matched with a single search
+PRODUCT_GONE_REPLY = re.compile("non trovato|eliminato", re.IGNORECASE)
+UPDATED_REPLY = re.compile("aggiornato|successo", re.IGNORECASE)
+NAME_TOO_SHORT_REPLY = re.compile("corto|3", re.IGNORECASE)
+NAME_TOO_LONG_REPLY = re.compile("lungo|100", re.IGNORECASE)
+THRESHOLD_TOO_HIGH_REPLY = re.compile("inferiore|minore", re.IGNORECASE)
 
 # =================================================================================================
 # start_update tests (Step 1: Show product list)
@@ -24,14 +33,10 @@ from handlers.update import (
 
 
 @pytest.mark.asyncio
-async def test_start_update_no_products(test_db):
+async def test_start_update_no_products(seeded_user):
     """Test /update with no products."""
-    await database.add_user(user_id=123, language_code="it")
-
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
+    update = make_update()
+    context = SimpleNamespace(user_data={})
 
     result = await start_update(update, context)
 
@@ -45,10 +50,8 @@ async def test_start_update_no_products(test_db):
 
 
 @pytest.mark.asyncio
-async def test_start_update_shows_product_list(test_db):
+async def test_start_update_shows_product_list(seeded_user, tomorrow):
     """Test /update shows product list with inline buttons."""
-    await database.add_user(user_id=123, language_code="it")
-    tomorrow = date.today() + timedelta(days=1)
     await database.add_product(
         user_id=123,
         product_name="Product 1",
@@ -66,10 +69,8 @@ async def test_start_update_shows_product_list(test_db):
         return_deadline=tomorrow,
     )
 
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
+    update = make_update()
+    context = SimpleNamespace(user_data={})
 
     result = await start_update(update, context)
 
@@ -93,14 +94,9 @@ async def test_start_update_shows_product_list(test_db):
 @pytest.mark.asyncio
 async def test_handle_product_selection_cancel(test_db):
     """Test canceling product selection."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.callback_query = MagicMock()
-    update.callback_query.answer = AsyncMock()
-    update.callback_query.edit_message_text = AsyncMock()
-    update.callback_query.data = "update_cancel"
+    update = make_callback_update("update_cancel")
 
-    context = MagicMock()
+    context = SimpleNamespace(user_data={})
 
     result = await handle_product_selection(update, context)
 
@@ -114,10 +110,8 @@ async def test_handle_product_selection_cancel(test_db):
 
 
 @pytest.mark.asyncio
-async def test_handle_product_selection_shows_fields(test_db):
+async def test_handle_product_selection_shows_fields(seeded_user, tomorrow):
     """Test product selection shows field options."""
-    await database.add_user(user_id=123, language_code="it")
-    tomorrow = date.today() + timedelta(days=1)
     await database.add_product(
         user_id=123,
         product_name="Test Product",
@@ -130,15 +124,9 @@ async def test_handle_product_selection_shows_fields(test_db):
     products = await database.get_user_products(123)
     product_id = products[0]["id"]
 
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.callback_query = MagicMock()
-    update.callback_query.answer = AsyncMock()
-    update.callback_query.edit_message_text = AsyncMock()
-    update.callback_query.data = f"update_product_{product_id}"
+    update = make_callback_update(f"update_product_{product_id}")
 
-    context = MagicMock()
-    context.user_data = {}
+    context = SimpleNamespace(user_data={})
 
     result = await handle_product_selection(update, context)
 
@@ -164,15 +152,9 @@ async def test_handle_product_selection_shows_fields(test_db):
 @pytest.mark.asyncio
 async def test_handle_field_selection_price(test_db):
     """Test selecting price field."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.callback_query = MagicMock()
-    update.callback_query.answer = AsyncMock()
-    update.callback_query.edit_message_text = AsyncMock()
-    update.callback_query.data = "update_field_prezzo"
+    update = make_callback_update("update_field_prezzo")
 
-    context = MagicMock()
-    context.user_data = {}
+    context = SimpleNamespace(user_data={})
 
     result = await handle_field_selection(update, context)
 
@@ -192,15 +174,9 @@ async def test_handle_field_selection_price(test_db):
 @pytest.mark.asyncio
 async def test_handle_field_selection_deadline(test_db):
     """Test selecting deadline field."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.callback_query = MagicMock()
-    update.callback_query.answer = AsyncMock()
-    update.callback_query.edit_message_text = AsyncMock()
-    update.callback_query.data = "update_field_scadenza"
+    update = make_callback_update("update_field_scadenza")
 
-    context = MagicMock()
-    context.user_data = {}
+    context = SimpleNamespace(user_data={})
 
     result = await handle_field_selection(update, context)
 
@@ -220,15 +196,9 @@ async def test_handle_field_selection_deadline(test_db):
 @pytest.mark.asyncio
 async def test_handle_field_selection_threshold(test_db):
     """Test selecting threshold field."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.callback_query = MagicMock()
-    update.callback_query.answer = AsyncMock()
-    update.callback_query.edit_message_text = AsyncMock()
-    update.callback_query.data = "update_field_soglia"
+    update = make_callback_update("update_field_soglia")
 
-    context = MagicMock()
-    context.user_data = {"update_product_price_paid": 59.90}
+    context = SimpleNamespace(user_data={"update_product_price_paid": 59.90})
 
     result = await handle_field_selection(update, context)
 
@@ -251,10 +221,8 @@ async def test_handle_field_selection_threshold(test_db):
 
 
 @pytest.mark.asyncio
-async def test_handle_value_input_price_success(test_db):
+async def test_handle_value_input_price_success(seeded_user, tomorrow):
     """Test successful price update."""
-    await database.add_user(user_id=123, language_code="it")
-    tomorrow = date.today() + timedelta(days=1)
     await database.add_product(
         user_id=123,
         product_name="Test Product",
@@ -267,17 +235,15 @@ async def test_handle_value_input_price_success(test_db):
     products = await database.get_user_products(123)
     product_id = products[0]["id"]
 
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.text = "55.00"
-    update.message.reply_text = AsyncMock()
+    update = make_update("55.00")
 
-    context = MagicMock()
-    context.user_data = {
-        "update_product_id": product_id,
-        "update_product_asin": "ASIN00001",
-        "update_field": "prezzo",
-    }
+    context = SimpleNamespace(
+        user_data={
+            "update_product_id": product_id,
+            "update_product_asin": "ASIN00001",
+            "update_field": "prezzo",
+        }
+    )
 
     result = await handle_value_input(update, context)
 
@@ -296,10 +262,8 @@ async def test_handle_value_input_price_success(test_db):
 
 
 @pytest.mark.asyncio
-async def test_handle_value_input_price_invalid(test_db):
+async def test_handle_value_input_price_invalid(seeded_user, tomorrow):
     """Test price update with invalid value."""
-    await database.add_user(user_id=123, language_code="it")
-    tomorrow = date.today() + timedelta(days=1)
     await database.add_product(
         user_id=123,
         product_name="Test Product",
@@ -312,17 +276,15 @@ async def test_handle_value_input_price_invalid(test_db):
     products = await database.get_user_products(123)
     product_id = products[0]["id"]
 
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.text = "invalid"
-    update.message.reply_text = AsyncMock()
+    update = make_update("invalid")
 
-    context = MagicMock()
-    context.user_data = {
-        "update_product_id": product_id,
-        "update_product_asin": "ASIN00001",
-        "update_field": "prezzo",
-    }
+    context = SimpleNamespace(
+        user_data={
+            "update_product_id": product_id,
+            "update_product_asin": "ASIN00001",
+            "update_field": "prezzo",
+        }
+    )
 
     result = await handle_value_input(update, context)
 
@@ -340,10 +302,8 @@ async def test_handle_value_input_price_invalid(test_db):
 
 
 @pytest.mark.asyncio
-async def test_handle_value_input_deadline_success(test_db):
+async def test_handle_value_input_deadline_success(seeded_user, tomorrow, today):
     """Test successful deadline update."""
-    await database.add_user(user_id=123, language_code="it")
-    tomorrow = date.today() + timedelta(days=1)
     await database.add_product(
         user_id=123,
         product_name="Test Product",
@@ -356,17 +316,15 @@ async def test_handle_value_input_deadline_success(test_db):
     products = await database.get_user_products(123)
     product_id = products[0]["id"]
 
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.text = "60"  # 60 days from now
-    update.message.reply_text = AsyncMock()
+    update = make_update("60")  # 60 days from now
 
-    context = MagicMock()
-    context.user_data = {
-        "update_product_id": product_id,
-        "update_product_asin": "ASIN00001",
-        "update_field": "scadenza",
-    }
+    context = SimpleNamespace(
+        user_data={
+            "update_product_id": product_id,
+            "update_product_asin": "ASIN00001",
+            "update_field": "scadenza",
+        }
+    )
 
     result = await handle_value_input(update, context)
 
@@ -377,7 +335,7 @@ async def test_handle_value_input_deadline_success(test_db):
 
     # Verify deadline was updated
     updated_products = await database.get_user_products(123)
-    expected_deadline = (date.today() + timedelta(days=60)).isoformat()
+    expected_deadline = (today + timedelta(days=60)).isoformat()
     assert updated_products[0]["return_deadline"] == expected_deadline
 
     # Verify conversation ended
@@ -385,10 +343,8 @@ async def test_handle_value_input_deadline_success(test_db):
 
 
 @pytest.mark.asyncio
-async def test_handle_value_input_threshold_success(test_db):
+async def test_handle_value_input_threshold_success(seeded_user, tomorrow):
     """Test successful threshold update."""
-    await database.add_user(user_id=123, language_code="it")
-    tomorrow = date.today() + timedelta(days=1)
     await database.add_product(
         user_id=123,
         product_name="Test Product",
@@ -401,18 +357,16 @@ async def test_handle_value_input_threshold_success(test_db):
     products = await database.get_user_products(123)
     product_id = products[0]["id"]
 
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.message.text = "10.00"
-    update.message.reply_text = AsyncMock()
+    update = make_update("10.00")
 
-    context = MagicMock()
-    context.user_data = {
-        "update_product_id": product_id,
-        "update_product_asin": "ASIN00001",
-        "update_product_price_paid": 50.0,
-        "update_field": "soglia",
-    }
+    context = SimpleNamespace(
+        user_data={
+            "update_product_id": product_id,
+            "update_product_asin": "ASIN00001",
+            "update_product_price_paid": 50.0,
+            "update_field": "soglia",
+        }
+    )
 
     result = await handle_value_input(update, context)
 
@@ -438,11 +392,9 @@ async def test_handle_value_input_threshold_success(test_db):
 @pytest.mark.asyncio
 async def test_cancel():
     """Test /cancel command."""
-    update = MagicMock()
-    update.message.reply_text = AsyncMock()
+    update = make_update()
 
-    context = MagicMock()
-    context.user_data = {"update_product_id": 1, "update_field": "prezzo"}
+    context = SimpleNamespace(user_data={"update_product_id": 1, "update_field": "prezzo"})
 
     result = await cancel(update, context)
 
@@ -464,7 +416,7 @@ async def test_cancel():
 
 
 @pytest.mark.asyncio
-async def test_handle_product_selection_product_not_found(test_db):
+async def test_handle_product_selection_product_not_found(test_db, today):
     """Test when selected product doesn't exist (was deleted)."""
     user_id = 123
 
@@ -476,27 +428,21 @@ async def test_handle_product_selection_product_not_found(test_db):
         asin="B08N5WRWNW",
         marketplace="it",
         price_paid=50.0,
-        return_deadline=date.today() + timedelta(days=30),
+        return_deadline=today + timedelta(days=30),
     )
     await database.delete_product(product_id, user_id)
 
     # Mock callback query
-    update = MagicMock()
-    update.effective_user.id = user_id
-    update.callback_query = MagicMock()
-    update.callback_query.data = f"update_product_{product_id}"
-    update.callback_query.answer = AsyncMock()
-    update.callback_query.edit_message_text = AsyncMock()
+    update = make_callback_update(f"update_product_{product_id}", user_id=user_id)
 
-    context = MagicMock()
-    context.user_data = {}
+    context = SimpleNamespace(user_data={})
 
     result = await handle_product_selection(update, context)
 
     # Verify error message
     call_args = update.callback_query.edit_message_text.call_args
     message = call_args[0][0]
-    assert "non trovato" in message.lower() or "eliminato" in message.lower()
+    assert PRODUCT_GONE_REPLY.search(message)
 
     # Verify conversation ended
     assert result == ConversationHandler.END
@@ -508,14 +454,9 @@ async def test_handle_field_selection_cancel(test_db):
     user_id = 123
 
     # Mock callback query
-    update = MagicMock()
-    update.callback_query.from_user.id = user_id
-    update.callback_query.data = "update_cancel"
-    update.callback_query.answer = AsyncMock()
-    update.callback_query.edit_message_text = AsyncMock()
+    update = make_callback_update("update_cancel", user_id=user_id)
 
-    context = MagicMock()
-    context.user_data = {"update_product_id": 1}
+    context = SimpleNamespace(user_data={"update_product_id": 1})
 
     result = await handle_field_selection(update, context)
 
@@ -537,17 +478,14 @@ async def test_handle_field_selection_nome(test_db):
     user_id = 123
 
     # Mock callback query
-    update = MagicMock()
-    update.callback_query.from_user.id = user_id
-    update.callback_query.data = "update_field_nome"
-    update.callback_query.answer = AsyncMock()
-    update.callback_query.edit_message_text = AsyncMock()
-
-    context = MagicMock()
-    context.user_data = {
-        "update_product_id": 1,
-        "update_product_name": "Old Name",
-    }
+    update = make_callback_update("update_field_nome", user_id=user_id)
+
+    context = SimpleNamespace(
+        user_data={
+            "update_product_id": 1,
+            "update_product_name": "Old Name",
+        }
+    )
 
     result = await handle_field_selection(update, context)
 
@@ -564,10 +502,9 @@ async def test_handle_field_selection_nome(test_db):
 
 
 @pytest.mark.asyncio
-async def test_handle_value_input_name_success(test_db):
+async def test_handle_value_input_name_success(test_db, tomorrow):
     """Test successfully updating product name."""
     user_id = 123
-    tomorrow = date.today() + timedelta(days=1)
 
     # Add user and product
     await database.add_user(user_id, "it")
@@ -581,18 +518,16 @@ async def test_handle_value_input_name_success(test_db):
     )
 
     # Mock update
-    update = MagicMock()
-    update.effective_user.id = user_id
-    update.message.text = "New Product Name"
-    update.message.reply_text = AsyncMock()
-
-    context = MagicMock()
-    context.user_data = {
-        "update_product_id": product_id,
-        "update_product_name": "Old Name",
-        "update_product_asin": "B08N5WRWNW",
-        "update_field": "nome",
-    }
+    update = make_update("New Product Name", user_id=user_id)
+
+    context = SimpleNamespace(
+        user_data={
+            "update_product_id": product_id,
+            "update_product_name": "Old Name",
+            "update_product_asin": "B08N5WRWNW",
+            "update_field": "nome",
+        }
+    )
 
     result = await handle_value_input(update, context)
 
@@ -604,7 +539,7 @@ async def test_handle_value_input_name_success(test_db):
     # Verify success message
     call_args = update.message.reply_text.call_args
     message = call_args[0][0]
-    assert "aggiornato" in message.lower() or "successo" in message.lower()
+    assert UPDATED_REPLY.search(message)
 
     # Verify conversation ended
     assert result == ConversationHandler.END
@@ -616,25 +551,23 @@ async def test_handle_value_input_name_too_short(test_db):
     user_id = 123
 
     # Mock update
-    update = MagicMock()
-    update.effective_user.id = user_id
-    update.message.text = "AB"  # Too short (< 3 chars)
-    update.message.reply_text = AsyncMock()
-
-    context = MagicMock()
-    context.user_data = {
-        "update_product_id": 1,
-        "update_product_name": "Old Name",
-        "update_product_asin": "B08N5WRWNW",
-        "update_field": "nome",
-    }
+    update = make_update("AB", user_id=user_id)  # Too short (< 3 chars)
+
+    context = SimpleNamespace(
+        user_data={
+            "update_product_id": 1,
+            "update_product_name": "Old Name",
+            "update_product_asin": "B08N5WRWNW",
+            "update_field": "nome",
+        }
+    )
 
     result = await handle_value_input(update, context)
 
     # Verify error message
     call_args = update.message.reply_text.call_args
     message = call_args[0][0]
-    assert "corto" in message.lower() or "3" in message
+    assert NAME_TOO_SHORT_REPLY.search(message)
 
     # Verify conversation continues
     assert result == WAITING_VALUE_INPUT
@@ -646,25 +579,23 @@ async def test_handle_value_input_name_too_long(test_db):
     user_id = 123
 
     # Mock update
-    update = MagicMock()
-    update.effective_user.id = user_id
-    update.message.text = "A" * 101  # Too long (> 100 chars)
-    update.message.reply_text = AsyncMock()
-
-    context = MagicMock()
-    context.user_data = {
-        "update_product_id": 1,
-        "update_product_name": "Old Name",
-        "update_product_asin": "B08N5WRWNW",
-        "update_field": "nome",
-    }
+    update = make_update("A" * 101, user_id=user_id)  # Too long (> 100 chars)
+
+    context = SimpleNamespace(
+        user_data={
+            "update_product_id": 1,
+            "update_product_name": "Old Name",
+            "update_product_asin": "B08N5WRWNW",
+            "update_field": "nome",
+        }
+    )
 
     result = await handle_value_input(update, context)
 
     # Verify error message
     call_args = update.message.reply_text.call_args
     message = call_args[0][0]
-    assert "lungo" in message.lower() or "100" in message
+    assert NAME_TOO_LONG_REPLY.search(message)
 
     # Verify conversation continues
     assert result == WAITING_VALUE_INPUT
@@ -676,18 +607,16 @@ async def test_handle_value_input_unknown_field(test_db):
     user_id = 123
 
     # Mock update
-    update = MagicMock()
-    update.effective_user.id = user_id
-    update.message.text = "some value"
-    update.message.reply_text = AsyncMock()
-
-    context = MagicMock()
-    context.user_data = {
-        "update_product_id": 1,
-        "update_product_name": "Product",
-        "update_product_asin": "B08N5WRWNW",
-        "update_field": "unknown_field",  # Invalid field
-    }
+    update = make_update("some value", user_id=user_id)
+
+    context = SimpleNamespace(
+        user_data={
+            "update_product_id": 1,
+            "update_product_name": "Product",
+            "update_product_asin": "B08N5WRWNW",
+            "update_field": "unknown_field",  # Invalid field
+        }
+    )
 
     result = await handle_value_input(update, context)
 
@@ -704,26 +633,24 @@ async def test_handle_value_input_threshold_too_high(test_db):
     user_id = 123
 
     # Mock update
-    update = MagicMock()
-    update.effective_user.id = user_id
-    update.message.text = "60"  # >= price_paid (50)
-    update.message.reply_text = AsyncMock()
-
-    context = MagicMock()
-    context.user_data = {
-        "update_product_id": 1,
-        "update_product_name": "Product",
-        "update_product_asin": "B08N5WRWNW",
-        "update_product_price_paid": 50.0,
-        "update_field": "soglia",
-    }
+    update = make_update("60", user_id=user_id)  # >= price_paid (50)
+
+    context = SimpleNamespace(
+        user_data={
+            "update_product_id": 1,
+            "update_product_name": "Product",
+            "update_product_asin": "B08N5WRWNW",
+            "update_product_price_paid": 50.0,
+            "update_field": "soglia",
+        }
+    )
 
     result = await handle_value_input(update, context)
 
     # Verify error message
     call_args = update.message.reply_text.call_args
     message = call_args[0][0]
-    assert "inferiore" in message.lower() or "minore" in message.lower()
+    assert THRESHOLD_TOO_HIGH_REPLY.search(message)
 
     # Verify conversation continues
     assert result == WAITING_VALUE_INPUT
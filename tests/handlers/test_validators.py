@@ -1,11 +1,21 @@
 """Tests for validators module."""
 
+import re
 from datetime import date, timedelta
 
 import pytest
 
 from handlers import validators
 
+# parse_deadline error messages, compiled once for pytest.raises(match=...)
+DAYS_RANGE_ERROR = re.compile("tra 1 e 365")
+FORMAT_ERROR = re.compile("Formato non valido")
+INVALID_DATE_ERROR = re.compile("Data non valida")
+YEAR_ERROR = re.compile("Anno deve essere")
+PAST_DATE_ERROR = re.compile("nel passato")
+TODAY_ERROR = re.compile("La scadenza è oggi")
+TOO_FAR_ERROR = re.compile("troppo lontana")
+
 # =================================================================================================
 # validate_product_name tests
 # =================================================================================================
@@ -245,25 +255,25 @@ def test_validate_threshold_too_high():
 # =================================================================================================
 
 
-def test_parse_deadline_from_days():
+def test_parse_deadline_from_days(today):
     """Test parsing deadline from number of days."""
     # 1 day
     deadline = validators.parse_deadline("1")
-    assert deadline == date.today() + timedelta(days=1)
+    assert deadline == today + timedelta(days=1)
 
     # 30 days
     deadline = validators.parse_deadline("30")
-    assert deadline == date.today() + timedelta(days=30)
+    assert deadline == today + timedelta(days=30)
 
     # 365 days (max)
     deadline = validators.parse_deadline("365")
-    assert deadline == date.today() + timedelta(days=365)
+    assert deadline == today + timedelta(days=365)
 
 
-def test_parse_deadline_from_date_gg_mm_aaaa():
+def test_parse_deadline_from_date_gg_mm_aaaa(today):
     """Test parsing deadline from date format gg-mm-aaaa."""
     # Future date with dash (use a date 60 days from now to ensure it's always future)
-    future_date = date.today() + timedelta(days=60)
+    future_date = today + timedelta(days=60)
     date_str_dash = future_date.strftime("%d-%m-%Y")
     deadline = validators.parse_deadline(date_str_dash)
     assert deadline == future_date
@@ -274,114 +284,129 @@ def test_parse_deadline_from_date_gg_mm_aaaa():
     assert deadline == future_date
 
 
-def test_parse_deadline_from_date_aaaa_mm_gg():
+def test_parse_deadline_from_date_aaaa_mm_gg(today):
     """Test parsing deadline from ISO date format aaaa-mm-gg."""
     # Use a date 90 days from now to ensure it's always future
-    future_date = date.today() + timedelta(days=90)
+    future_date = today + timedelta(days=90)
     date_str = future_date.strftime("%Y-%m-%d")
     deadline = validators.parse_deadline(date_str)
     assert deadline == future_date
 
 
+def test_parse_deadline_cache_is_keyed_by_today():
+    """Test cached deadlines are reused for the same day and recomputed on the next."""
+    today = date(2025, 1, 15)
+    assert validators._parse_deadline_on("30", today) == date(2025, 2, 14)
+    assert validators._parse_deadline_on("30", today + timedelta(days=1)) == date(2025, 2, 15)
+
+    hits = validators._parse_deadline_on.cache_info().hits
+    assert validators._parse_deadline_on("30", today) == date(2025, 2, 14)
+    assert validators._parse_deadline_on.cache_info().hits == hits + 1
+
+
 def test_parse_deadline_invalid_days():
     """Test invalid number of days."""
     # Zero days
-    with pytest.raises(ValueError, match="tra 1 e 365"):
+    with pytest.raises(ValueError, match=DAYS_RANGE_ERROR):
         validators.parse_deadline("0")
 
     # Negative days
-    with pytest.raises(ValueError, match="tra 1 e 365"):
+    with pytest.raises(ValueError, match=DAYS_RANGE_ERROR):
         validators.parse_deadline("-10")
 
     # Too many days
-    with pytest.raises(ValueError, match="tra 1 e 365"):
+    with pytest.raises(ValueError, match=DAYS_RANGE_ERROR):
         validators.parse_deadline("366")
 
 
 def test_parse_deadline_invalid_date_format():
     """Test invalid date formats."""
+    # Not a number nor a date
+    with pytest.raises(ValueError, match=FORMAT_ERROR):
+        validators.parse_deadline("invalid")
+
     # Wrong number of parts
-    with pytest.raises(ValueError, match="Formato non valido"):
+    with pytest.raises(ValueError, match=FORMAT_ERROR):
         validators.parse_deadline("15-12")
 
-    with pytest.raises(ValueError, match="Formato non valido"):
+    with pytest.raises(ValueError, match=FORMAT_ERROR):
         validators.parse_deadline("15-12-2025-extra")
 
     # Invalid date (month 13)
-    with pytest.raises(ValueError, match="Data non valida"):
+    with pytest.raises(ValueError, match=INVALID_DATE_ERROR):
         validators.parse_deadline("15-13-2025")
 
     # Invalid date (day 32)
-    with pytest.raises(ValueError, match="Data non valida"):
+    with pytest.raises(ValueError, match=INVALID_DATE_ERROR):
         validators.parse_deadline("32-12-2025")
 
     # Two-digit year
-    with pytest.raises(ValueError, match="Anno deve essere"):
+    with pytest.raises(ValueError, match=YEAR_ERROR):
         validators.parse_deadline("15-12-25")
 
 
-def test_parse_deadline_past_date():
+def test_parse_deadline_past_date(today):
     """Test date in the past."""
     # Yesterday
-    yesterday = date.today() - timedelta(days=1)
+    yesterday = today - timedelta(days=1)
     date_str = yesterday.strftime("%d-%m-%Y")
 
-    with pytest.raises(ValueError, match="nel passato"):
+    with pytest.raises(ValueError, match=PAST_DATE_ERROR):
         validators.parse_deadline(date_str)
 
     # Far in the past
-    with pytest.raises(ValueError, match="nel passato"):
+    with pytest.raises(ValueError, match=PAST_DATE_ERROR):
         validators.parse_deadline("01-01-2020")
 
 
-def test_parse_deadline_today():
+def test_parse_deadline_today(today):
     """Test today's date (should fail - bot needs at least 1 day to monitor)."""
-    today_str = date.today().strftime("%d-%m-%Y")
+    today_str = today.strftime("%d-%m-%Y")
 
-    with pytest.raises(ValueError, match="La scadenza è oggi"):
+    with pytest.raises(ValueError, match=TODAY_ERROR):
         validators.parse_deadline(today_str)
 
 
-def test_parse_deadline_with_whitespace():
+def test_parse_deadline_with_whitespace(today):
     """Test deadline parsing with extra whitespace."""
     deadline = validators.parse_deadline("  30  ")
-    assert deadline == date.today() + timedelta(days=30)
+    assert deadline == today + timedelta(days=30)
 
     # Use a date 45 days from now to ensure it's always future
-    future_date = date.today() + timedelta(days=45)
+    future_date = today + timedelta(days=45)
     date_str = future_date.strftime("%d-%m-%Y")
     deadline = validators.parse_deadline(f"  {date_str}  ")
     assert deadline == future_date
 
 
-def test_parse_deadline_date_exactly_365_days():
+def test_parse_deadline_date_exactly_365_days(today):
     """Test date exactly 365 days in the future (should pass)."""
-    future_date = date.today() + timedelta(days=365)
+    future_date = today + timedelta(days=365)
     date_str = future_date.strftime("%d-%m-%Y")
 
     deadline = validators.parse_deadline(date_str)
     assert deadline == future_date
 
 
-def test_parse_deadline_date_beyond_365_days():
+def test_parse_deadline_date_beyond_365_days(today):
     """Test date beyond 365 days (should fail)."""
     # 366 days (just over the limit)
-    future_date = date.today() + timedelta(days=366)
+    future_date = today + timedelta(days=366)
     date_str = future_date.strftime("%d-%m-%Y")
 
-    with pytest.raises(ValueError, match="troppo lontana"):
+    with pytest.raises(ValueError, match=TOO_FAR_ERROR):
         validators.parse_deadline(date_str)
 
     # 400 days (well over the limit)
-    future_date = date.today() + timedelta(days=400)
+    future_date = today + timedelta(days=400)
     date_str = future_date.strftime("%d-%m-%Y")
 
-    with pytest.raises(ValueError, match="troppo lontana"):
+    with pytest.raises(ValueError, match=TOO_FAR_ERROR):
         validators.parse_deadline(date_str)
 
     # Far future (e.g., 2 years)
-    future_date = date.today() + timedelta(days=730)
+    future_date = today + timedelta(days=730)
     date_str = future_date.strftime("%d-%m-%Y")
 
-    with pytest.raises(ValueError, match="troppo lontana"):
+    with pytest.raises(ValueError, match=TOO_FAR_ERROR):
         validators.parse_deadline(date_str)
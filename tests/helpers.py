@@ -0,0 +1,122 @@
+"""Helpers shared by the test modules."""
+
+from datetime import UTC, date, datetime
+from types import SimpleNamespace
+from typing import NamedTuple
+
+import database
+
+# Today's UTC date, read once at import: the today fixture and the handlers'
+# frozen clock both use it, so module-level test constants can be derived from it
+TODAY = datetime.now(UTC).date()
+
+
+class RecordedCall(NamedTuple):
+    """Arguments of one recorded call, indexable like a mock's call_args."""
+
+    args: tuple
+    kwargs: dict
+
+
+class CallRecorder:
+    """
+    Async stand-in for AsyncMock on the reply methods of fake updates.
+
+    Each awaited call is stored as a RecordedCall, so tests keep using
+    call_args, call_args_list, call_count, assert_called_once and
+    assert_not_called without AsyncMock's per-call mock bookkeeping.
+    """
+
+    def __init__(self):
+        self.call_args_list = []
+
+    async def __call__(self, *args, **kwargs):
+        self.call_args_list.append(RecordedCall(args, kwargs))
+
+    @property
+    def call_count(self) -> int:
+        return len(self.call_args_list)
+
+    @property
+    def call_args(self):
+        return self.call_args_list[-1] if self.call_args_list else None
+
+    def assert_called_once(self) -> None:
+        assert self.call_count == 1, f"Expected 1 call, got {self.call_count}"
+
+    def assert_not_called(self) -> None:
+        assert not self.call_args_list, f"Expected no calls, got {self.call_args_list}"
+
+
+def make_update(text=None, user_id=123, language_code="it"):
+    """
+    Build a fake Telegram update for a text message sent by a user.
+
+    Plain namespaces instead of MagicMock: the handlers only read a few fields,
+    and only reply_text needs call tracking (see CallRecorder).
+    """
+    return SimpleNamespace(
+        effective_user=SimpleNamespace(id=user_id, language_code=language_code),
+        message=SimpleNamespace(text=text, reply_text=CallRecorder()),
+    )
+
+
+def make_callback_update(data, user_id=123, language_code="it"):
+    """Build a fake Telegram update for an inline button press carrying data."""
+    return SimpleNamespace(
+        effective_user=SimpleNamespace(id=user_id, language_code=language_code),
+        callback_query=SimpleNamespace(
+            data=data, answer=CallRecorder(), edit_message_text=CallRecorder()
+        ),
+    )
+
+
+def last_reply(reply_mock) -> str:
+    """Return the text of the last message sent through a mocked reply method."""
+    return reply_mock.call_args.args[0]
+
+
+def assert_reply_contains(reply_mock, *needles: str) -> None:
+    """Assert the last reply sent through reply_mock contains every needle."""
+    message = last_reply(reply_mock)
+    for needle in needles:
+        assert needle in message, f"{needle!r} not in reply: {message!r}"
+
+
+async def bulk_add_users(user_ids, language_code: str = "it") -> None:
+    """Insert a user for each of user_ids in a single transaction."""
+    db = await database.get_db()
+    await db.executemany(
+        "INSERT INTO users (user_id, language_code) VALUES (?, ?)",
+        [(user_id, language_code) for user_id in user_ids],
+    )
+    await db.commit()
+
+
+async def bulk_add_products(user_id: int, count: int, return_deadline: date) -> None:
+    """Insert count products for user_id in a single transaction."""
+    db = await database.get_db()
+    await db.executemany(
+        """
+        INSERT INTO products (user_id, product_name, asin, marketplace, price_paid, return_deadline)
+        VALUES (?, ?, ?, 'it', 50.0, ?)
+        """,
+        [
+            (user_id, f"Product {i + 1}", f"B0TEST{i + 1:04d}", return_deadline.isoformat())
+            for i in range(count)
+        ],
+    )
+    await db.commit()
+
+
+async def seed_referral_pair(referrer_id: int, user_id: int, max_products: int = 6) -> None:
+    """Insert a referrer and the user it referred, both with max_products slots, in one commit."""
+    db = await database.get_db()
+    await db.executemany(
+        """
+        INSERT INTO users (user_id, language_code, max_products, referred_by)
+        VALUES (?, 'it', ?, ?)
+        """,
+        [(referrer_id, max_products, None), (user_id, max_products, referrer_id)],
+    )
+    await db.commit()
@@ -2,11 +2,13 @@
 
 import asyncio
 from datetime import UTC, datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
 import bot
+from tests.helpers import make_update
 
 
 def test_calculate_next_run_future():
@@ -158,12 +160,8 @@ async def test_run_cleanup_error_handling():
 @pytest.mark.asyncio
 async def test_start_handler():
     """Test /start command handler."""
-    update = MagicMock()
-    update.effective_user.id = 123
-    update.effective_user.language_code = "it"
-    update.message.reply_text = AsyncMock()
-    context = MagicMock()
-    context.args = []  # No referral code
+    update = make_update()
+    context = SimpleNamespace(args=[])  # No referral code
 
     await bot.start_handler(update, context)
 
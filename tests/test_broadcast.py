@@ -6,6 +6,7 @@ import pytest
 
 import broadcast
 import database
+from tests.helpers import bulk_add_users
 
 
 @pytest.mark.asyncio
@@ -139,8 +140,7 @@ async def test_broadcast_message_exception_handling(test_db):
 async def test_broadcast_message_batching(test_db):
     """Test that broadcast processes users in batches."""
     # Add more users than batch size
-    for i in range(30):  # More than BATCH_SIZE (10)
-        await database.add_user(user_id=100 + i, language_code="it")
+    await bulk_add_users(range(100, 130))  # More than BATCH_SIZE (10)
 
     with patch("broadcast.send_message_to_user", new_callable=AsyncMock) as mock_send:
         mock_send.return_value = True
@@ -1,7 +1,8 @@
 """Tests for Amazon data reader."""
 
+import asyncio
 import os
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 
@@ -36,20 +37,29 @@ def test_extract_asin_with_product_name():
     assert marketplace == "it"
 
 
-def test_extract_asin_different_marketplaces():
-    """Test ASIN extraction from different marketplaces."""
-    test_cases = [
-        ("https://amazon.com/dp/B08N5WRWNW", "B08N5WRWNW", "com"),
-        ("https://amazon.de/dp/B08N5WRWNW", "B08N5WRWNW", "de"),
-        ("https://amazon.fr/dp/B08N5WRWNW", "B08N5WRWNW", "fr"),
-        ("https://amazon.es/dp/B08N5WRWNW", "B08N5WRWNW", "es"),
-        ("https://amazon.co.uk/dp/B08N5WRWNW", "B08N5WRWNW", "uk"),
-    ]
+def test_extract_asin_short_link():
+    """Test ASIN extraction from amzn.eu /d/ short link (defaults to .it)."""
+    url = "https://amzn.eu/d/B08N5WRWNW"
+    asin, marketplace = data_reader.extract_asin(url)
+    assert asin == "B08N5WRWNW"
+    assert marketplace == "it"
 
-    for url, expected_asin, expected_marketplace in test_cases:
-        asin, marketplace = data_reader.extract_asin(url)
-        assert asin == expected_asin
-        assert marketplace == expected_marketplace
+
+@pytest.mark.parametrize(
+    "url, expected_marketplace",
+    [
+        ("https://amazon.com/dp/B08N5WRWNW", "com"),
+        ("https://amazon.de/dp/B08N5WRWNW", "de"),
+        ("https://amazon.fr/dp/B08N5WRWNW", "fr"),
+        ("https://amazon.es/dp/B08N5WRWNW", "es"),
+        ("https://amazon.co.uk/dp/B08N5WRWNW", "uk"),
+    ],
+)
+def test_extract_asin_different_marketplaces(url, expected_marketplace):
+    """Test ASIN extraction from different marketplaces."""
+    asin, marketplace = data_reader.extract_asin(url)
+    assert asin == "B08N5WRWNW"
+    assert marketplace == expected_marketplace
 
 
 def test_extract_asin_invalid_url():
@@ -184,41 +194,97 @@ async def test_scrape_single_price_success():
     # Mock Playwright components
     mock_page = AsyncMock()
     mock_element = AsyncMock()
+    mock_element.is_visible = AsyncMock(return_value=True)
     mock_element.inner_text = AsyncMock(return_value="€59,90")
-    mock_page.wait_for_selector = AsyncMock(return_value=mock_element)
+    mock_page.wait_for_selector = AsyncMock()
+    mock_page.query_selector = AsyncMock(return_value=mock_element)
     mock_page.goto = AsyncMock()
-    mock_page.set_extra_http_headers = AsyncMock()
-    mock_page.close = AsyncMock()
-
-    mock_browser = MagicMock()
-    mock_browser.new_page = AsyncMock(return_value=mock_page)
 
     # Call function
-    price = await data_reader._scrape_single_price(mock_browser, "B08N5WRWNW", "it")
+    price = await data_reader._scrape_single_price(mock_page, "B08N5WRWNW", "it")
 
     # Verify
     assert price == 59.90
     mock_page.goto.assert_called_once()
     assert "amazon.it/dp/B08N5WRWNW" in mock_page.goto.call_args[0][0]
+    # Wait for any selector, then briefly for the most specific one, which is read
+    assert mock_page.wait_for_selector.await_args_list == [
+        call(data_reader.PRICE_SELECTOR_ANY, state="attached", timeout=5000),
+        call(data_reader.PRICE_SELECTORS[0], timeout=data_reader.PRIMARY_PRICE_GRACE_MS),
+    ]
+    mock_page.query_selector.assert_awaited_once_with(data_reader.PRICE_SELECTORS[0])
+    # Element handle is released since the page is reused across ASINs
+    mock_element.dispose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_scrape_single_price_falls_back_to_next_selector():
+    """Test that missing or hidden selectors are skipped in priority order."""
+    hidden_element = AsyncMock()
+    hidden_element.is_visible = AsyncMock(return_value=False)
+    visible_element = AsyncMock()
+    visible_element.is_visible = AsyncMock(return_value=True)
+    visible_element.inner_text = AsyncMock(return_value="€19,99")
+
+    mock_page = AsyncMock()
+    mock_page.wait_for_selector = AsyncMock()
+    mock_page.query_selector = AsyncMock(side_effect=[None, hidden_element, visible_element])
+    mock_page.goto = AsyncMock()
+
+    price = await data_reader._scrape_single_price(mock_page, "B08N5WRWNW", "it")
+
+    assert price == 19.99
+    hidden_element.inner_text.assert_not_awaited()
+    hidden_element.dispose.assert_awaited_once()
+    visible_element.dispose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_scrape_single_price_prefers_most_specific_of_several_candidates():
+    """Test that the highest-priority price wins when several price nodes are visible."""
+    # Variant/other-seller prices rendered, the buy box price never shows up
+    candidates = {
+        data_reader.PRICE_SELECTORS[2]: "€49,90",
+        data_reader.PRICE_SELECTORS[4]: "€39,90",
+        data_reader.PRICE_SELECTORS[-1]: "€29,90",
+    }
+    elements = {}
+
+    def query_selector(selector):
+        if selector not in candidates:
+            return None
+        element = AsyncMock()
+        element.is_visible = AsyncMock(return_value=True)
+        element.inner_text = AsyncMock(return_value=candidates[selector])
+        elements[selector] = element
+        return element
+
+    mock_page = AsyncMock()
+    mock_page.wait_for_selector = AsyncMock(
+        side_effect=[None, data_reader.TimeoutError("Primary selector not found")]
+    )
+    mock_page.query_selector = AsyncMock(side_effect=query_selector)
+    mock_page.goto = AsyncMock()
+
+    price = await data_reader._scrape_single_price(mock_page, "B08N5WRWNW", "it")
+
+    assert price == 49.90
+    # Lower-priority candidates are never queried once a match is found
+    assert list(elements) == [data_reader.PRICE_SELECTORS[2]]
 
 
 @pytest.mark.asyncio
 async def test_scrape_single_price_not_found():
     """Test price scraping when price element not found."""
-    # Mock Playwright components - all selectors fail
+    # Mock Playwright components - no price selector appears
     mock_page = AsyncMock()
     mock_page.wait_for_selector = AsyncMock(
         side_effect=data_reader.TimeoutError("Selector not found")
     )
     mock_page.goto = AsyncMock()
-    mock_page.set_extra_http_headers = AsyncMock()
-    mock_page.close = AsyncMock()
-
-    mock_browser = MagicMock()
-    mock_browser.new_page = AsyncMock(return_value=mock_page)
 
     # Call function
-    price = await data_reader._scrape_single_price(mock_browser, "B08N5WRWNW", "it")
+    price = await data_reader._scrape_single_price(mock_page, "B08N5WRWNW", "it")
 
     # Should return None when price not found
     assert price is None
@@ -230,18 +296,108 @@ async def test_scrape_single_price_network_error():
     # Mock Playwright components - goto fails
     mock_page = AsyncMock()
     mock_page.goto = AsyncMock(side_effect=Exception("Network error"))
-    mock_page.set_extra_http_headers = AsyncMock()
-
-    mock_browser = MagicMock()
-    mock_browser.new_page = AsyncMock(return_value=mock_page)
 
     # Call function
-    price = await data_reader._scrape_single_price(mock_browser, "B08N5WRWNW", "it")
+    price = await data_reader._scrape_single_price(mock_page, "B08N5WRWNW", "it")
 
     # Should return None on error
     assert price is None
 
 
+@pytest.mark.asyncio
+async def test_block_heavy_resources_aborts_images():
+    """Test that image requests are aborted."""
+    mock_route = AsyncMock()
+    mock_route.request = MagicMock(resource_type="image")
+
+    await data_reader._block_heavy_resources(mock_route)
+
+    mock_route.abort.assert_awaited_once()
+    mock_route.continue_.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_block_heavy_resources_allows_documents():
+    """Test that document and script requests are let through."""
+    for resource_type in ["document", "script", "stylesheet"]:
+        mock_route = AsyncMock()
+        mock_route.request = MagicMock(resource_type=resource_type)
+
+        await data_reader._block_heavy_resources(mock_route)
+
+        mock_route.continue_.assert_awaited_once()
+        mock_route.abort.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_scrape_prices_reuses_single_page():
+    """Test that successful ASINs share one page with resource blocking enabled."""
+    products = [
+        {"id": 1, "asin": "ASIN00001"},
+        {"id": 2, "asin": "ASIN00002"},
+    ]
+    pages_used = []
+
+    async def mock_scrape(page, asin, marketplace):
+        pages_used.append(page)
+        return 50.00
+
+    with patch("data_reader._scrape_single_price", side_effect=mock_scrape):
+        with patch("data_reader.async_playwright") as mock_playwright:
+            mock_page = MagicMock()
+            mock_context = MagicMock()
+            mock_context.route = AsyncMock()
+            mock_context.new_page = AsyncMock(return_value=mock_page)
+            mock_browser = AsyncMock()
+            mock_browser.new_context = AsyncMock(return_value=mock_context)
+            mock_playwright.return_value.__aenter__.return_value.chromium.connect_over_cdp = (
+                AsyncMock(return_value=mock_browser)
+            )
+
+            await data_reader.scrape_prices(products, rate_limit_seconds=0)
+
+            mock_browser.new_context.assert_awaited_once_with(user_agent=data_reader.USER_AGENT)
+            mock_context.route.assert_awaited_once_with("**/*", data_reader._block_heavy_resources)
+            mock_context.new_page.assert_awaited_once()
+            assert pages_used == [mock_page, mock_page]
+
+
+@pytest.mark.asyncio
+async def test_scrape_prices_replaces_page_after_failure():
+    """Test that a failed scrape moves the remaining ASINs to a fresh page."""
+    products = [
+        {"id": 1, "asin": "ASIN00001"},
+        {"id": 2, "asin": "ASIN00002"},
+        {"id": 3, "asin": "ASIN00003"},
+    ]
+    pages_used = []
+
+    async def mock_scrape(page, asin, marketplace):
+        pages_used.append(page)
+        return None if asin == "ASIN00001" else 50.00
+
+    with patch("data_reader._scrape_single_price", side_effect=mock_scrape):
+        with patch("data_reader.async_playwright") as mock_playwright:
+            broken_page = AsyncMock()
+            broken_page.close = AsyncMock(side_effect=data_reader.Error("Target crashed"))
+            fresh_page = AsyncMock()
+            mock_context = MagicMock()
+            mock_context.route = AsyncMock()
+            mock_context.new_page = AsyncMock(side_effect=[broken_page, fresh_page])
+            mock_browser = AsyncMock()
+            mock_browser.new_context = AsyncMock(return_value=mock_context)
+            mock_playwright.return_value.__aenter__.return_value.chromium.connect_over_cdp = (
+                AsyncMock(return_value=mock_browser)
+            )
+
+            results = await data_reader.scrape_prices(products, rate_limit_seconds=0)
+
+    # Closing the broken page fails, but the run carries on with the fresh page
+    assert pages_used == [broken_page, fresh_page, fresh_page]
+    assert results == {2: 50.00, 3: 50.00}
+    fresh_page.close.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_scrape_prices_multiple_products():
     """Test scraping multiple products."""
@@ -393,6 +549,48 @@ async def test_scrape_prices_deduplication_different_marketplaces():
             assert results[3] == 100.00  # it marketplace (duplicate)
 
 
+@pytest.mark.asyncio
+async def test_scrape_prices_rate_limit_overlaps_page_load():
+    """Test that the rate-limit delay runs concurrently with the page load."""
+    products = [
+        {"id": 1, "asin": "ASIN00001"},
+        {"id": 2, "asin": "ASIN00002"},
+    ]
+    events = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(delay):
+        events.append(f"sleep {delay} start")
+        await real_sleep(0)  # Yield so the page load can interleave
+        events.append(f"sleep {delay} end")
+
+    async def mock_scrape(page, asin, marketplace):
+        events.append(f"load {asin} start")
+        await real_sleep(0)
+        events.append(f"load {asin} end")
+        return 50.00
+
+    with patch("data_reader._scrape_single_price", side_effect=mock_scrape):
+        with patch("data_reader.asyncio.sleep", side_effect=fake_sleep):
+            with patch("data_reader.async_playwright") as mock_playwright:
+                mock_browser = AsyncMock()
+                mock_playwright.return_value.__aenter__.return_value.chromium.connect_over_cdp = (
+                    AsyncMock(return_value=mock_browser)
+                )
+                mock_browser.close = AsyncMock()
+
+                results = await data_reader.scrape_prices(products, rate_limit_seconds=0.2)
+
+    assert results == {1: 50.00, 2: 50.00}
+    # One delay, between the two ASINs (none after the last one)
+    assert [e for e in events if e.startswith("sleep")] == ["sleep 0.2 start", "sleep 0.2 end"]
+    # The delay starts before the first page load ends and ends after it started: overlap
+    assert events.index("sleep 0.2 start") < events.index("load ASIN00001 end")
+    assert events.index("load ASIN00001 start") < events.index("sleep 0.2 end")
+    # The next page load waits for the delay to finish
+    assert events.index("sleep 0.2 end") < events.index("load ASIN00002 start")
+
+
 # ============================================================================
 # scrape_price() wrapper tests
 # ============================================================================
@@ -17,7 +17,7 @@ async def test_init_db_creates_tables(test_db):
     """Test that init_db creates all required tables."""
     import aiosqlite
 
-    async with aiosqlite.connect(test_db) as db:
+    async with aiosqlite.connect(test_db, uri=True) as db:
         # Check users table exists
         async with db.execute(
             "SELECT name FROM sqlite_master WHERE type='table' AND name='users'"
@@ -42,7 +42,7 @@ async def test_init_db_creates_indexes(test_db):
     """Test that init_db creates performance indexes."""
     import aiosqlite
 
-    async with aiosqlite.connect(test_db) as db:
+    async with aiosqlite.connect(test_db, uri=True) as db:
         # Check simple indexes exist
         async with db.execute(
             "SELECT name FROM sqlite_master WHERE type='index' AND name='idx_user_products'"
@@ -169,6 +169,21 @@ async def test_set_user_max_products_capped_at_default(test_db):
     assert limit == database.DEFAULT_MAX_PRODUCTS
 
 
+@pytest.mark.asyncio
+async def test_get_user_product_limit_sees_direct_updates(test_db):
+    """Test that limits changed outside set_user_max_products are read back at once."""
+    await database.add_user(111, "it")
+    await database.set_user_max_products(111, 6)
+    assert await database.get_user_product_limit(111) == 6
+
+    # e.g. a manual admin edit making the user unlimited again
+    db = await database.get_db()
+    await db.execute("UPDATE users SET max_products = NULL WHERE user_id = ?", (111,))
+    await db.commit()
+
+    assert await database.get_user_product_limit(111) == database.DEFAULT_MAX_PRODUCTS
+
+
 @pytest.mark.asyncio
 async def test_increment_user_product_limit(test_db):
     """Test incrementing user's product limit."""
@@ -300,7 +315,7 @@ async def test_add_product_atomic_first_product(test_db):
 
 
 @pytest.mark.asyncio
-async def test_add_product_atomic_concurrent_safety(test_db):
+async def test_add_product_atomic_concurrent_safety(file_test_db):
     """Test add_product_atomic prevents race conditions with concurrent inserts."""
     await database.add_user(123456, "it")
 
@@ -347,7 +362,7 @@ async def test_add_product_atomic_concurrent_safety(test_db):
 
 
 @pytest.mark.asyncio
-async def test_product_limit_trigger_enforcement(test_db):
+async def test_product_limit_trigger_enforcement(file_test_db):
     """Test database trigger enforces product limit and prevents race conditions."""
     import aiosqlite
 
@@ -613,8 +628,8 @@ async def test_update_product_wrong_user(test_db):
 
 
 @pytest.mark.asyncio
-async def test_delete_expired_products(test_db):
-    """Test deleting expired products."""
+async def test_delete_expired_products_and_mark_run(test_db):
+    """Test that cleanup deletes expired products and records the run together."""
     await database.add_user(123456, "it")
 
     # Add active products
@@ -628,8 +643,7 @@ async def test_delete_expired_products(test_db):
     await database.add_product(123456, "Expired 1", "EXPIRED01", "de", 70.0, past_date1)
     await database.add_product(123456, "Expired 2", "EXPIRED02", "fr", 80.0, past_date2)
 
-    # Delete expired
-    count = await database.delete_expired_products()
+    count = await database.delete_expired_products_and_mark_run("2024-01-15T02:00:00+00:00")
     assert count == 2
 
     # Verify only active products remain
@@ -637,6 +651,9 @@ async def test_delete_expired_products(test_db):
     assert len(products) == 2
     assert {p["asin"] for p in products} == {"ACTIVE001", "ACTIVE002"}
 
+    status = await database.get_system_status("last_cleanup_run")
+    assert status["value"] == "2024-01-15T02:00:00+00:00"
+
 
 # ============================================================================
 # Feedback operation tests
@@ -2,9 +2,10 @@
 
 import asyncio
 import contextlib
+import json
 import os
 from datetime import datetime, timedelta
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from aiohttp import web
@@ -12,6 +13,15 @@ from aiohttp import web
 import database
 import health_handler
 
+
+@pytest.fixture(autouse=True)
+def reset_health_cache():
+    """Ensure every test starts without a cached health status."""
+    health_handler.reset_health_cache()
+    yield
+    health_handler.reset_health_cache()
+
+
 # ============================================================================
 # Database system_status tests
 # ============================================================================
@@ -123,6 +133,26 @@ async def test_get_stats_deduplication(test_db):
     # 3. (ASIN002, it)
 
 
+@pytest.mark.asyncio
+async def test_get_health_snapshot_matches_separate_queries(test_db):
+    """Test that get_health_snapshot returns the same data as get_stats + get_all_system_status."""
+    from datetime import date
+
+    await database.add_user(111, "it")
+    future_date = date.today() + timedelta(days=10)
+    await database.add_product(111, "Product 1", "ASIN001", "it", 50.0, future_date)
+    await database.increment_metric("products_total_count", 4.0)
+    await database.increment_metric("total_savings_generated", 12.345)
+    await database.update_system_status("last_scraper_run", "2024-01-15T10:00:00")
+
+    stats, system_status = await database.get_health_snapshot()
+
+    assert stats == await database.get_stats()
+    assert system_status == await database.get_all_system_status()
+    assert stats["products_total_count"] == 4
+    assert stats["total_savings_generated"] == 12.35
+
+
 # ============================================================================
 # Health check logic tests
 # ============================================================================
@@ -335,7 +365,7 @@ async def test_check_task_health_invalid_timestamp(test_db):
 
     # Get system status
     system_status = await database.get_all_system_status()
-    threshold = datetime.now()
+    threshold = health_handler._timestamp_key(datetime.now().isoformat())
 
     # Call _check_task_health (bot_startup_time not relevant for error case)
     task_status, is_healthy = health_handler._check_task_health(
@@ -348,6 +378,78 @@ async def test_check_task_health_invalid_timestamp(test_db):
     assert task_status["last_run"] == "invalid-timestamp"
 
 
+def test_timestamp_key_normalizes_stored_formats():
+    """Test that aware, naive and space-separated timestamps map to comparable keys."""
+    assert health_handler._timestamp_key("2024-01-15T10:00:00.123456+00:00") == (
+        "2024-01-15T10:00:00"
+    )
+    assert health_handler._timestamp_key("2024-01-15T10:00:00") == "2024-01-15T10:00:00"
+    assert health_handler._timestamp_key("2024-01-15 10:00:00") == "2024-01-15T10:00:00"
+    # Offsets are converted to UTC before comparing
+    assert health_handler._timestamp_key("2024-01-15T12:00:00+02:00") == "2024-01-15T10:00:00"
+    assert health_handler._timestamp_key("invalid-timestamp") is None
+    # Well-formed but impossible values are rejected, not compared
+    assert health_handler._timestamp_key("2024-13-45 99:99:99") is None
+    assert health_handler._timestamp_key(None) is None
+
+
+# ============================================================================
+# Health status cache tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_cached_health_status_reused_within_ttl():
+    """Test that repeated calls within the TTL reuse the first result."""
+    status = {"status": "healthy"}
+    with (
+        patch("health_handler.HEALTH_CACHE_TTL", 60.0),
+        patch("health_handler.get_health_status", new_callable=AsyncMock) as mock_status,
+    ):
+        mock_status.return_value = status
+
+        first = await health_handler.get_cached_health_status()
+        second = await health_handler.get_cached_health_status()
+
+    assert first is status
+    assert second is status
+    mock_status.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_cached_health_status_refreshed_after_ttl():
+    """Test that an expired cache entry is recomputed."""
+    with (
+        patch("health_handler.HEALTH_CACHE_TTL", 60.0),
+        patch("health_handler.get_health_status", new_callable=AsyncMock) as mock_status,
+        patch("health_handler.time.monotonic") as mock_monotonic,
+    ):
+        mock_status.side_effect = [{"status": "healthy"}, {"status": "unhealthy"}]
+        mock_monotonic.side_effect = [100.0, 161.0, 161.0, 161.0]
+
+        first = await health_handler.get_cached_health_status()
+        second = await health_handler.get_cached_health_status()
+
+    assert first["status"] == "healthy"
+    assert second["status"] == "unhealthy"
+    assert mock_status.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_health_status_disabled_with_zero_ttl():
+    """Test that HEALTH_CACHE_TTL=0 computes a fresh status on every call."""
+    with (
+        patch("health_handler.HEALTH_CACHE_TTL", 0),
+        patch("health_handler.get_health_status", new_callable=AsyncMock) as mock_status,
+    ):
+        mock_status.return_value = {"status": "healthy"}
+
+        await health_handler.get_cached_health_status()
+        await health_handler.get_cached_health_status()
+
+    assert mock_status.await_count == 2
+
+
 # ============================================================================
 # Server configuration and startup tests
 # ============================================================================
@@ -408,6 +510,22 @@ def test_health_bind_address_from_env():
         importlib.reload(health_handler)
 
 
+def test_encode_health_body_reuses_bytes_for_same_status():
+    """Test that the serialized body is reused for the same cached status object."""
+    status = {"status": "healthy", "stats": {"users": 1}}
+
+    first = health_handler._encode_health_body(status)
+    second = health_handler._encode_health_body(status)
+
+    assert second is first
+    assert first == json.dumps(status, indent=2, ensure_ascii=False).encode("utf-8")
+
+    # A different status object is serialized again
+    other = health_handler._encode_health_body({"status": "unhealthy"})
+    assert other is not first
+    assert json.loads(other) == {"status": "unhealthy"}
+
+
 # ============================================================================
 # aiohttp handler tests
 # ============================================================================
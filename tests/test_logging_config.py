@@ -6,7 +6,7 @@ import tempfile
 from logging.handlers import TimedRotatingFileHandler
 from pathlib import Path
 
-from utils.logging_config import setup_rotating_file_handler
+from utils.logging_config import setup_queue_logging, setup_rotating_file_handler
 
 
 def test_setup_rotating_file_handler_creates_data_directory():
@@ -153,3 +153,32 @@ def test_setup_rotating_file_handler_with_existing_data_dir():
             handler.close()
         finally:
             os.chdir(original_cwd)
+
+
+def test_setup_queue_logging_writes_through_listener():
+    """Test that records logged via the queue handler reach the wrapped handlers."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        original_cwd = os.getcwd()
+        try:
+            os.chdir(tmpdir)
+            file_handler = setup_rotating_file_handler("data/test.log")
+            queue_handler, listener = setup_queue_logging([file_handler])
+
+            logger = logging.getLogger("test_queue_logger")
+            logger.addHandler(queue_handler)
+            logger.setLevel(logging.INFO)
+            listener.start()
+            try:
+                logger.info("Queued message")
+            finally:
+                # stop() drains the queue before returning
+                listener.stop()
+                logger.removeHandler(queue_handler)
+                file_handler.close()
+
+            content = Path("data/test.log").read_text()
+            assert "test_queue_logger - INFO - Queued message" in content
+            # Message is formatted once, not prefixed twice
+            assert content.count(" - INFO - ") == 1
+        finally:
+            os.chdir(original_cwd)
@@ -182,9 +182,10 @@ async def test_cleanup_expired_products_updates_system_status(test_db):
 @pytest.mark.asyncio
 async def test_cleanup_error_handling(test_db):
     """Test error handling during cleanup."""
-    # Mock database.delete_expired_products to raise an exception
+    # Mock the cleanup transaction to raise an exception
     with patch(
-        "product_cleanup.database.delete_expired_products", side_effect=Exception("DB Error")
+        "product_cleanup.database.delete_expired_products_and_mark_run",
+        side_effect=Exception("DB Error"),
     ):
         with pytest.raises(Exception, match="DB Error"):
             await product_cleanup.cleanup_expired_products()
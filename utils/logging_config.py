@@ -2,7 +2,8 @@
 
 import logging
 import os
-from logging.handlers import TimedRotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 
 
 def setup_rotating_file_handler(
@@ -39,3 +40,36 @@ def setup_rotating_file_handler(
     handler.setFormatter(logging.Formatter(format_string))
 
     return handler
+
+
+def setup_queue_logging(
+    handlers: list[logging.Handler],
+    format_string: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+) -> tuple[QueueHandler, QueueListener]:
+    """
+    Route log records through a queue so handler I/O runs on a background thread.
+
+    File and stream writes are blocking; done directly from async code they stall
+    the event loop. The returned QueueHandler only enqueues records, and the
+    listener (which must be started) writes them with the given handlers.
+
+    Args:
+        handlers: Handlers that perform the actual output
+        format_string: Format applied to handlers that have no formatter yet
+
+    Returns:
+        Tuple of (queue_handler, listener) - attach queue_handler to the logger,
+        call listener.start() at startup and listener.stop() at shutdown
+    """
+    formatter = logging.Formatter(format_string)
+    for handler in handlers:
+        if handler.formatter is None:
+            handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    # Records are rendered by the listener's handlers; keep only the message here
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    return queue_handler, listener